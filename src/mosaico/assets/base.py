@@ -64,6 +64,13 @@ class BaseAsset(Media, Generic[_ParamsType, _InfoType]):
         :param params: The parameters to update.
         :return: A new assets with the specified parameters.
         """
+        if isinstance(params, type(self.params)):
+            # Already validated params of the same class can be merged field by field,
+            # skipping the dump and revalidation round-trip.
+            updates = {field_name: getattr(params, field_name) for field_name in params.model_fields_set}
+            self.params = self.params.model_copy(update=updates)
+            return self
+
         if isinstance(params, BaseModel):
             params = params.model_dump(exclude_unset=True)
 
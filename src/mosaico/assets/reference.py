@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Mapping, Sequence
 from typing import Any, cast
 
 from pydantic import BaseModel
 from pydantic.config import ConfigDict
-from pydantic.fields import Field
 from pydantic.functional_validators import model_validator
 from pydantic.types import NonNegativeFloat
 
@@ -33,20 +33,17 @@ class AssetReference(BaseModel):
     end_time: NonNegativeFloat = 0
     """The end time of the asset in seconds."""
 
-    effects: list[VideoEffect] = Field(default_factory=list)
+    effects: tuple[VideoEffect, ...] = ()
     """The effects to apply to the asset."""
 
-    model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @model_validator(mode="after")
     def _check_asset_params_type(self) -> AssetReference:
         """
         Check the asset params type.
         """
-        asset_params_cls = get_asset_params_class(self.asset_type)
-        if self.asset_params is not None and not isinstance(self.asset_params, asset_params_cls):
-            msg = f"Asset params must be of type {asset_params_cls.__name__}."
-            raise ValueError(msg)
+        _check_asset_params_type(self.asset_type, self.asset_params)
         return self
 
     @property
@@ -79,7 +76,7 @@ class AssetReference(BaseModel):
             asset_params=asset_params or asset.params,
             start_time=start_time if start_time is not None else 0,
             end_time=end_time if end_time is not None else 0,
-            effects=list(effects) if effects is not None else [],
+            effects=effects if effects is not None else (),
         )
 
     @classmethod
@@ -94,11 +91,17 @@ class AssetReference(BaseModel):
             msg = "Missing 'asset_type' key in asset reference data."
             raise ValueError(msg)
 
-        if "asset_params" in data and data["asset_params"] is not None:
-            params_cls = get_asset_params_class(data["asset_type"])
-            data["asset_params"] = params_cls.model_validate(data["asset_params"])
+        # Params are validated once against the class of the asset type, instead of being
+        # checked against every member of the params union and then type-checked again.
+        data = dict(data)
+        asset_params = data.pop("asset_params", None)
+        reference = cls.model_validate(data)
+
+        if asset_params is not None:
+            params_cls = _get_asset_params_class(reference.asset_type)
+            reference.asset_params = params_cls.model_validate(asset_params)
 
-        return cls.model_validate(data)
+        return reference
 
     def with_params(self, params: AssetParams) -> AssetReference:
         """
@@ -106,7 +109,9 @@ class AssetReference(BaseModel):
 
         :param params: The scene params to add.
         :return: The asset reference.
+        :raises ValueError: If the params type does not match the asset type.
         """
+        _check_asset_params_type(self.asset_type, params)
         self.asset_params = params
         return self
 
@@ -116,7 +121,10 @@ class AssetReference(BaseModel):
 
         :param start_time: The start time to add.
         :return: The asset reference.
+        :raises ValueError: If the start time is negative.
         """
+        if start_time < 0:
+            raise ValueError("Start time must be non-negative.")
         self.start_time = start_time
         return self
 
@@ -126,7 +134,10 @@ class AssetReference(BaseModel):
 
         :param end_time: The end time to add.
         :return: The asset reference.
+        :raises ValueError: If the end time is negative.
         """
+        if end_time < 0:
+            raise ValueError("End time must be non-negative.")
         self.end_time = end_time
         return self
 
@@ -137,6 +148,26 @@ class AssetReference(BaseModel):
         :param effects: The effects to add.
         :return: The asset reference.
         """
-        effects = cast(list[VideoEffect], effects)
-        self.effects.extend(effects)
+        effects = cast(Sequence[VideoEffect], effects)
+        self.effects = (*self.effects, *effects)
         return self
+
+
+def _check_asset_params_type(asset_type: AssetType, asset_params: AssetParams | None) -> None:
+    """
+    Check that the asset params match the asset type.
+    """
+    if asset_params is None:
+        return
+    asset_params_cls = _get_asset_params_class(asset_type)
+    if not isinstance(asset_params, asset_params_cls):
+        msg = f"Asset params must be of type {asset_params_cls.__name__}."
+        raise ValueError(msg)
+
+
+@functools.lru_cache(maxsize=16)
+def _get_asset_params_class(asset_type: AssetType) -> type[AssetParams]:
+    """
+    Get the asset params class for the given asset type, resolving each type only once.
+    """
+    return get_asset_params_class(asset_type)
@@ -11,6 +11,11 @@ from mosaico.assets.base import BaseAsset
 from mosaico.positioning import AbsolutePosition, Position
 
 
+# Colors are immutable, so every params instance shares these defaults instead of parsing its own colors.
+_BLACK = Color("#000000")
+_TRANSPARENT = Color("transparent")
+
+
 class TextAssetParams(BaseModel):
     """Represents the parameters for a text assets."""
 
@@ -23,7 +28,7 @@ class TextAssetParams(BaseModel):
     font_size: NonNegativeInt = 70
     """The font size."""
 
-    font_color: Color = Field(default_factory=lambda: Color("#000000"))
+    font_color: Color = _BLACK
     """The font color hexadecimal code."""
 
     font_kerning: float = 0
@@ -32,13 +37,13 @@ class TextAssetParams(BaseModel):
     line_height: int = 10
     """The line height."""
 
-    stroke_color: Color = Field(default_factory=lambda: Color("#000000"))
+    stroke_color: Color = _BLACK
     """The font stroke color hexadecimal code."""
 
     stroke_width: NonNegativeFloat = 0
     """The font stroke width."""
 
-    shadow_color: Color = Field(default_factory=lambda: Color("#000000"))
+    shadow_color: Color = _BLACK
     """The shadow color hexadecimal code."""
 
     shadow_blur: int = 0
@@ -53,7 +58,7 @@ class TextAssetParams(BaseModel):
     shadow_distance: NonNegativeInt = 0
     """The shadow distance."""
 
-    background_color: Color = Field(default_factory=lambda: Color("transparent"))
+    background_color: Color = _TRANSPARENT
     """The background color hexadecimal code."""
 
     align: Literal["left", "center", "right"] = "left"
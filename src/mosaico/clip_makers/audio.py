@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import contextlib
 import os
+import shutil
 from tempfile import NamedTemporaryFile
 
+import numpy as np
 from moviepy.audio import fx as afx
+from moviepy.audio.AudioClip import AudioArrayClip
 from moviepy.audio.io.AudioFileClip import AudioFileClip
 from moviepy.Clip import Clip
 from pydub import AudioSegment
@@ -20,9 +23,10 @@ class AudioClipMaker(BaseClipMaker[AudioAsset]):
 
     The audio clip maker performs these transformations:
 
-    1. Loads raw audio data into PyDub format
+    1. Loads raw audio data into PyDub format, if it needs to be trimmed or cropped
     2. Crops if needed to match clip duration
-    3. Exports audio to temporary MP3 file
+    3. Makes the clip from the edited samples in memory, or streams unedited audio data
+       from a temporary copy
 
     __Examples__:
 
@@ -44,17 +48,16 @@ class AudioClipMaker(BaseClipMaker[AudioAsset]):
         :return: The audio clip.
         """
         clip_duration = self.duration if self.duration is not None else asset.duration
+        volume_effect = afx.MultiplyVolume(asset.params.volume)
 
-        with (
-            asset.to_bytes_io() as audio_buf,
-            NamedTemporaryFile(mode="wb", suffix=".mp3", dir=settings.resolved_temp_dir, delete=False) as fp,
-        ):
-            audio = AudioSegment.from_file(
-                file=audio_buf,
-                sample_width=asset.sample_width,
-                frame_rate=asset.sample_rate,
-                channels=asset.channels,
-            )
+        if asset.duration > clip_duration or asset.params.crop is not None:
+            with asset.to_bytes_io() as audio_buf:
+                audio = AudioSegment.from_file(
+                    file=audio_buf,
+                    sample_width=asset.sample_width,
+                    frame_rate=asset.sample_rate,
+                    channels=asset.channels,
+                )
 
             if asset.duration > clip_duration:
                 audio = audio[: round(clip_duration * 1000)]
@@ -62,15 +65,28 @@ class AudioClipMaker(BaseClipMaker[AudioAsset]):
             if asset.params.crop is not None:
                 audio = audio[asset.params.crop[0] * 1000 : asset.params.crop[1] * 1000]
 
-            audio.export(fp.name, format="mp3")
+            return AudioArrayClip(_get_audio_samples(audio), fps=audio.frame_rate).with_effects([volume_effect])
+
+        # Unedited audio is copied as is, and ffmpeg detects its format from the content
+        with (
+            asset.to_bytes_io() as audio_buf,
+            NamedTemporaryFile(mode="wb", dir=settings.resolved_temp_dir, delete=False) as fp,
+        ):
+            shutil.copyfileobj(audio_buf, fp)
             temp_file_path = fp.name
 
         try:
-            clip = AudioFileClip(temp_file_path, fps=asset.sample_rate).with_effects(
-                [afx.MultiplyVolume(asset.params.volume)]
-            )
+            clip = AudioFileClip(temp_file_path, fps=asset.sample_rate).with_effects([volume_effect])
         finally:
             with contextlib.suppress(OSError, FileNotFoundError, PermissionError):
                 os.remove(temp_file_path)
 
         return clip
+
+
+def _get_audio_samples(audio: AudioSegment) -> np.ndarray:
+    """
+    Get the samples of an audio segment as a float array in [-1, 1], with one column per channel.
+    """
+    samples = np.frombuffer(audio.raw_data, dtype=f"<i{audio.sample_width}")
+    return (samples / audio.max_possible_amplitude).astype(np.float32).reshape(-1, audio.channels)
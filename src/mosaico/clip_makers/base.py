@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Annotated, Any, Generic, TypeVar
 
 from moviepy.Clip import Clip
 from pydantic import BaseModel
 from pydantic.config import ConfigDict
 from pydantic.fields import Field
+from pydantic.functional_validators import PlainValidator
 from pydantic.types import PositiveFloat
 
 from mosaico.assets.base import BaseAsset
@@ -17,6 +18,19 @@ from mosaico.types import FrameSize
 T = TypeVar("T", bound=BaseAsset)
 
 
+def _validate_effect(effect: Any) -> Effect:
+    """
+    Validate that the object implements the effect protocol.
+
+    This is the same structural check performed by ``isinstance(effect, Effect)``, without the overhead
+    of the runtime protocol machinery, since a clip maker is created for every rendered clip.
+    """
+    if not callable(getattr(effect, "apply", None)):
+        msg = f"Invalid effect: {type(effect).__name__} does not implement the 'apply' method."
+        raise ValueError(msg)
+    return effect
+
+
 class BaseClipMaker(BaseModel, Generic[T], ABC):
     """Base class for clip makers."""
 
@@ -26,7 +40,7 @@ class BaseClipMaker(BaseModel, Generic[T], ABC):
     video_resolution: FrameSize | None = None
     """The resolution of the video."""
 
-    effects: list[Effect] = Field(default_factory=list)
+    effects: list[Annotated[Effect, PlainValidator(_validate_effect)]] = Field(default_factory=list)
     """List of effects to apply to the clip."""
 
     model_config = ConfigDict(arbitrary_types_allowed=True, validate_assignment=True)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import importlib.util
 from collections.abc import Sequence
@@ -42,10 +43,13 @@ def get_clip_maker_class(asset_type: Literal["image"]) -> type[ClipMaker[ImageAs
 def get_clip_maker_class(asset_type: AssetType) -> type[ClipMaker]: ...
 
 
+@functools.lru_cache(maxsize=16)
 def get_clip_maker_class(asset_type: AssetType) -> type[ClipMaker]:
     """
     Get a clip maker class.
 
+    Lookups are cached, as a clip maker is created for every rendered clip.
+
     :param asset_type: The assets type.
     :return: The clip maker class.
     :raises ValueError: If no clip maker is found for the given assets type and name.
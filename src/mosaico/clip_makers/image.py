@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import contextlib
-import os
-import tempfile
+from collections.abc import Iterator
+from concurrent.futures import Future
+from contextvars import ContextVar
 
 import cv2 as cv
 import numpy as np
@@ -11,8 +12,28 @@ from moviepy.video.VideoClip import ImageClip
 
 from mosaico.assets.image import ImageAsset
 from mosaico.clip_makers.base import BaseClipMaker
-from mosaico.config import settings
 from mosaico.positioning.utils import is_relative_position
+from mosaico.types import FrameSize
+
+
+_COLOR_IMAGE_NDIM = 3
+
+_JPEG_MAGIC = b"\xff\xd8\xff"
+
+_REDUCED_DECODE_FLAGS = {
+    2: cv.IMREAD_REDUCED_COLOR_2 | cv.IMREAD_IGNORE_ORIENTATION,
+    4: cv.IMREAD_REDUCED_COLOR_4 | cv.IMREAD_IGNORE_ORIENTATION,
+    8: cv.IMREAD_REDUCED_COLOR_8 | cv.IMREAD_IGNORE_ORIENTATION,
+}
+"""OpenCV flags to scale JPEG images down while decoding, by reduction factor, ignoring EXIF orientation."""
+
+_RGB_CONVERSION_CODES = {3: cv.COLOR_BGR2RGB, 4: cv.COLOR_BGRA2RGBA}
+"""OpenCV color conversion codes from BGR(A) to RGB(A), by number of channels."""
+
+_decoded_images: ContextVar[dict[tuple[str, FrameSize | None], Future[np.ndarray]] | None] = ContextVar(
+    "decoded_images", default=None
+)
+"""Images decoded within a `decoded_image_cache` context, by asset id and target size."""
 
 
 class ImageClipMaker(BaseClipMaker[ImageAsset]):
@@ -23,9 +44,8 @@ class ImageClipMaker(BaseClipMaker[ImageAsset]):
 
     1. Loads raw image data into OpenCV format
     2. Resizes/crops if needed to match video resolution
-    3. Creates temporary image file
-    4. Constructs MoviePy ImageClip with:
-        - Image data from temp file
+    3. Constructs MoviePy ImageClip with:
+        - Decoded image data, converted to RGB(A)
         - Position from asset params
         - Duration from clip maker config
 
@@ -63,28 +83,102 @@ class ImageClipMaker(BaseClipMaker[ImageAsset]):
 
         position = asset.params.position
 
-        with tempfile.NamedTemporaryFile(mode="wb", suffix=".png", dir=settings.resolved_temp_dir, delete=False) as fp:
-            nparr = np.frombuffer(asset.to_bytes(), np.uint8)
-            image = cv.imdecode(nparr, cv.IMREAD_UNCHANGED)
+        # Resize the image if it's not the same resolution as the video
+        resize_to = None
+        if asset.size != self.video_resolution and asset.params.as_background:
+            resize_to = self.video_resolution
 
-            # Resize the image if it's not the same resolution as the video
-            if asset.size != self.video_resolution and asset.params.as_background:
-                image = _resize_and_crop(image, self.video_resolution)
+        clip = (
+            ImageClip(img=_decode_image_asset(asset, resize_to))
+            .with_position((position.x, position.y), relative=is_relative_position(position))
+            .with_duration(self.duration)
+        )
 
-            cv.imwrite(fp.name, image)
-            temp_file_path = fp.name
+        return clip
 
-        try:
-            clip = (
-                ImageClip(img=temp_file_path)
-                .with_position((position.x, position.y), relative=is_relative_position(position))
-                .with_duration(self.duration)
-            )
-        finally:
-            with contextlib.suppress(OSError, FileNotFoundError, PermissionError):
-                os.remove(temp_file_path)
 
-        return clip
+@contextlib.contextmanager
+def decoded_image_cache() -> Iterator[None]:
+    """
+    Share decoded images between the image clips made within the context, releasing them on exit.
+
+    The same image asset may back many clips (e.g. a logo shown in every scene), so each asset is decoded
+    once per target size. Images are cached by asset id, so the assets used within the context must have
+    unique ids, as those of a video project do.
+    """
+    token = _decoded_images.set({})
+    try:
+        yield
+    finally:
+        _decoded_images.reset(token)
+
+
+def _decode_image_asset(asset: ImageAsset, resize_to: FrameSize | None) -> np.ndarray:
+    """
+    Decode an image asset, resized and cropped to the given size, if any, reusing cached images, if any.
+
+    Clips may be made concurrently, so the first clip of an image claims its decoding, and the other clips wait
+    for its result instead of decoding the image again.
+    """
+    decoded_images = _decoded_images.get()
+
+    if decoded_images is None:
+        return _read_and_decode_image(asset, resize_to)
+
+    future: Future[np.ndarray] = Future()
+    cached_future = decoded_images.setdefault((asset.id, resize_to), future)
+    if cached_future is not future:
+        return cached_future.result()
+
+    try:
+        image = _read_and_decode_image(asset, resize_to)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+
+    future.set_result(image)
+    return image
+
+
+def _read_and_decode_image(asset: ImageAsset, resize_to: FrameSize | None) -> np.ndarray:
+    """
+    Read and decode an image asset, scaling JPEG images down while decoding when resizing them.
+    """
+    data = asset.to_bytes()
+    reduction = _get_decode_reduction(data, asset.size, resize_to) if resize_to is not None else 1
+    return _decode_image(data, resize_to, reduction)
+
+
+def _decode_image(data: bytes, resize_to: FrameSize | None, reduction: int = 1) -> np.ndarray:
+    """
+    Decode image data into an RGB(A) array, resized and cropped to the given size, if any.
+
+    The returned array may be shared between clips, so it is made read-only.
+    """
+    flags = _REDUCED_DECODE_FLAGS.get(reduction, cv.IMREAD_UNCHANGED)
+    image = cv.imdecode(np.frombuffer(data, np.uint8), flags)
+
+    if resize_to is not None:
+        image = _resize_and_crop(image, resize_to)
+
+    image = _to_rgb(image)
+    image.flags.writeable = False
+
+    return image
+
+
+def _get_decode_reduction(data: bytes, image_size: FrameSize, target_size: FrameSize) -> int:
+    """
+    Get the largest factor a JPEG image can be scaled down by while decoding, still covering the target size.
+
+    libjpeg scales images down while decoding at almost no cost, so large photos used as backgrounds are
+    neither fully decoded nor fully resized.
+    """
+    if not data.startswith(_JPEG_MAGIC):
+        return 1
+
+    max_reduction = min(image_size[0] / target_size[0], image_size[1] / target_size[1])
+    return next((reduction for reduction in (8, 4, 2) if reduction <= max_reduction), 1)
 
 
 def _resize_and_crop(image: cv.typing.MatLike, target_size: tuple[int, int]) -> cv.typing.MatLike:
@@ -114,7 +208,19 @@ def _resize_and_crop(image: cv.typing.MatLike, target_size: tuple[int, int]) ->
     # Crop the image
     cropped = image[start_y : start_y + new_h, start_x : start_x + new_w]
 
-    # Resize to target size
-    resized = cv.resize(cropped, target_size, interpolation=cv.INTER_CUBIC)
+    # Resize to target size, using pixel area resampling when shrinking
+    interpolation = cv.INTER_AREA if new_w > target_w and new_h > target_h else cv.INTER_CUBIC
+    resized = cv.resize(cropped, target_size, interpolation=interpolation)
 
     return resized
+
+
+def _to_rgb(image: cv.typing.MatLike) -> cv.typing.MatLike:
+    """
+    Convert an image decoded by OpenCV from BGR(A) to the RGB(A) channel order expected by MoviePy.
+    """
+    channels = image.shape[2] if image.ndim == _COLOR_IMAGE_NDIM else 1
+    conversion_code = _RGB_CONVERSION_CODES.get(channels)
+    if conversion_code is None:
+        return image
+    return cv.cvtColor(image, conversion_code)
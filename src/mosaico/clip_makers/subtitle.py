@@ -2,9 +2,6 @@ from __future__ import annotations
 
 from typing import cast
 
-from moviepy.Clip import Clip
-from moviepy.video.VideoClip import ImageClip
-
 from mosaico.assets.text import BaseTextAsset
 from mosaico.clip_makers.text import TextClipMaker
 
@@ -31,24 +28,20 @@ class SubtitleClipMaker(TextClipMaker):
     ```
     """
 
-    def _make_clip(self, asset: BaseTextAsset) -> Clip:
+    def _get_clip_position(self, asset: BaseTextAsset, clip_height: int) -> tuple[tuple, bool]:
         """
-        Create a clip from a subtitle asset.
+        Get the position of a subtitle clip at the top, bottom, or center of the video.
 
         :param asset: The subtitle asset.
-        :return: The subtitle clip.
+        :param clip_height: The height of the subtitle clip, in pixels.
+        :return: The clip position and whether it is relative to the video size.
         """
-        clip = super()._make_clip(asset)
-        clip = cast(ImageClip, clip)
         video_resolution = cast(tuple[int, int], self.video_resolution)
-        position = asset.params.position
 
-        match position.y:
+        match asset.params.position.y:
             case "top":
-                clip = clip.with_position(("center", video_resolution[1] * 0.2))
+                return ("center", video_resolution[1] * 0.2), False
             case "bottom":
-                clip = clip.with_position(("center", video_resolution[1] * 0.8 - clip.h // 2))
+                return ("center", video_resolution[1] * 0.8 - clip_height // 2), False
             case _:
-                clip = clip.with_position(("center", "center"))
-
-        return clip
+                return ("center", "center"), False
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
+import functools
 import math
 import sys
 from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
+import cv2 as cv
 import numpy as np
 from find_system_fonts_filename import get_system_fonts_filename
 from moviepy.Clip import Clip
 from moviepy.video.VideoClip import ImageClip
-from PIL import Image, ImageDraw, ImageFilter, ImageFont
+from PIL import Image, ImageColor, ImageDraw, ImageFont
 
 from mosaico.assets.text import BaseTextAsset
 from mosaico.clip_makers.base import BaseClipMaker
@@ -45,10 +47,10 @@ class TextClipMaker(BaseClipMaker[BaseTextAsset]):
     4. Image Composition:
         - Combines shadow and text layers if shadow enabled
         - Crops image to text boundaries
-        - Creates temporary PNG file for MoviePy
+        - Converts the result to an in-memory RGBA array
 
     5. Clip Creation:
-        - Converts rendered image to MoviePy clip
+        - Builds the MoviePy clip straight from the array, without disk I/O
         - Sets position based on text parameters
         - Applies specified duration
 
@@ -99,27 +101,11 @@ class TextClipMaker(BaseClipMaker[BaseTextAsset]):
         font = _load_font(params.font_family, params.font_size)
         text = asset.to_string()
         wrapped_text = _wrap_text(text, font, round(max_width * 0.9))
-        text_size = _get_font_text_size(wrapped_text, font)
+        text_size = _get_font_text_size(wrapped_text, font, params.line_height, round(params.stroke_width))
 
         # Ensure text size has minimum dimensions to avoid PIL errors with zero-sized images
         text_size = (max(text_size[0], 1), max(text_size[1], 1))
 
-        shadow_image = None
-
-        if asset.has_shadow:
-            shadow_image = _draw_text_shadow_image(
-                text=wrapped_text,
-                text_size=text_size,
-                font=font,
-                line_height=params.line_height,
-                align=params.align,
-                shadow_color=params.shadow_color.as_hex(),
-                shadow_blur=params.shadow_blur,
-                shadow_angle=params.shadow_angle,
-                shadow_opacity=params.shadow_opacity,
-                shadow_distance=params.shadow_distance,
-            )
-
         font_color = cast(RGBAColor, params.font_color.as_rgb_tuple(alpha=True))
 
         text_image = _draw_text_image(
@@ -132,25 +118,57 @@ class TextClipMaker(BaseClipMaker[BaseTextAsset]):
             stroke_width=params.stroke_width,
             align=params.align,
         )
-
-        if shadow_image is not None:
-            if shadow_image.size != text_image.size:
-                final_image = shadow_image.copy()
-                final_image.paste(text_image, (0, 0), text_image)
-            else:
-                final_image = Image.alpha_composite(shadow_image, text_image)
+        text_bbox = _get_content_bbox(text_image)
+
+        if text_bbox is None:
+            np_image = text_image
+        elif asset.has_shadow:
+            # Shadow and text are laid out on a canvas fitted to the text ink, the shadow offset and the
+            # blur spread, so the blur and the composition only go through the pixels that matter.
+            left, top, right, bottom = text_bbox
+            x_offset, y_offset = _get_shadow_offset(params.shadow_angle, params.shadow_distance)
+            blur_spread = math.ceil(3 * params.shadow_blur)
+            canvas_left = left + min(x_offset, 0) - blur_spread
+            canvas_top = top + min(y_offset, 0) - blur_spread
+            canvas_size = (
+                right + max(x_offset, 0) + blur_spread - canvas_left,
+                bottom + max(y_offset, 0) + blur_spread - canvas_top,
+            )
+            shadow_image = _draw_text_shadow_image(
+                text=wrapped_text,
+                font=font,
+                line_height=params.line_height,
+                align=params.align,
+                shadow_color=params.shadow_color.as_hex(),
+                shadow_blur=params.shadow_blur,
+                shadow_opacity=params.shadow_opacity,
+                canvas_size=canvas_size,
+                position=(x_offset - canvas_left, y_offset - canvas_top),
+            )
+            final_image = _alpha_composite(
+                shadow_image,
+                text_image[top:bottom, left:right],
+                position=(left - canvas_left, top - canvas_top),
+            )
+            np_image = _crop_to_content(final_image)
         else:
-            final_image = text_image.copy()
+            left, top, right, bottom = text_bbox
+            np_image = text_image[top:bottom, left:right]
 
-        bbox = final_image.getbbox()
-        final_image = final_image.crop(bbox)
-        np_image = np.asarray(final_image)
+        position, relative = self._get_clip_position(asset, np_image.shape[0])
 
-        return (
-            ImageClip(np_image)
-            .with_position((params.position.x, params.position.y), relative=is_relative_position(params.position))
-            .with_duration(self.duration)
-        )
+        return ImageClip(np_image).with_position(position, relative=relative).with_duration(self.duration)
+
+    def _get_clip_position(self, asset: BaseTextAsset, clip_height: int) -> tuple[tuple, bool]:
+        """
+        Get the position of a text clip in the video.
+
+        :param asset: The text asset.
+        :param clip_height: The height of the text clip, in pixels.
+        :return: The clip position and whether it is relative to the video size.
+        """
+        position = asset.params.position
+        return (position.x, position.y), is_relative_position(position)
 
 
 @dataclass
@@ -210,11 +228,21 @@ def _slugify_font_name(font_name: str) -> str:
     return slug
 
 
+@functools.cache
+def _get_system_fonts_paths() -> tuple[str, ...]:
+    """
+    Get the system font file paths.
+
+    Font discovery walks the system font directories, so it is done only once per process.
+    """
+    return tuple(get_system_fonts_filename())
+
+
 def _list_system_fonts() -> list[SystemFont]:
     """
     List the system fonts.
     """
-    return [SystemFont(path=path) for path in get_system_fonts_filename()]
+    return [SystemFont(path=path) for path in _get_system_fonts_paths()]
 
 
 def _get_system_fallback_font_name() -> str:
@@ -229,9 +257,12 @@ def _get_system_fallback_font_name() -> str:
         return "DejaVuSans-Bold"
 
 
+@functools.lru_cache(maxsize=128)
 def _load_font(font_family: str, font_size: int) -> ImageFont.FreeTypeFont:
     """
     Load the font with the given family and size.
+
+    Loaded fonts are cached by family and size, as they are only read from when drawing text.
     """
     available_fonts = _list_system_fonts()
     selected_font = next((font for font in available_fonts if font.matches(font_family)), None)
@@ -247,33 +278,59 @@ def _load_font(font_family: str, font_size: int) -> ImageFont.FreeTypeFont:
 def _wrap_text(text: str, font: ImageFont.FreeTypeFont, max_width: int) -> str:
     """
     Wrap the given text to fit within the given width.
+
+    Each word is measured once and line widths are accumulated, instead of re-measuring the whole line
+    every time a word is appended.
     """
+    if "\n" not in text and _get_line_width(text, font) <= max_width:
+        return text
+
+    space_width = font.getlength(" ")
     lines = []
     for line in text.split("\n"):
-        if _get_font_text_size(line, font)[0] <= max_width:
+        if _get_line_width(line, font) <= max_width:
             lines.append(line)
-        else:
-            words = line.split()
-            wrapped_line = ""
-            for word in words:
-                test_line = wrapped_line + word + " "
-                if _get_font_text_size(test_line, font)[0] <= max_width:
-                    wrapped_line = test_line
-                else:
-                    lines.append(wrapped_line)
-                    wrapped_line = word + " "
-            lines.append(wrapped_line)
+            continue
+
+        line_words: list[str] = []
+        line_width = 0.0
+        for word in line.split():
+            word_width = font.getlength(word)
+            if line_words and line_width + space_width + word_width > max_width:
+                lines.append(" ".join(line_words))
+                line_words = [word]
+                line_width = word_width
+            else:
+                line_width += word_width + space_width if line_words else word_width
+                line_words.append(word)
+        lines.append(" ".join(line_words))
     return "\n".join(lines)
 
 
-def _get_font_text_size(text: str, font: ImageFont.FreeTypeFont) -> tuple[int, int]:
+def _get_font_text_size(
+    text: str, font: ImageFont.FreeTypeFont, line_height: int = 0, stroke_width: int = 0
+) -> tuple[int, int]:
     """
-    Get the width and height of the text with the given font.
+    Get the width and height of the multiline text with the given font, line height and stroke width.
+
+    Lines are spaced the same way as in `ImageDraw.multiline_text`.
+    """
+    lines = text.split("\n")
+    ascent, descent = font.getmetrics()
+    line_spacing = font.getbbox("A", stroke_width=stroke_width)[3] + stroke_width + line_height
+    text_width = max(_get_line_width(line, font) for line in lines) + 2 * stroke_width
+    text_height = (len(lines) - 1) * line_spacing + ascent + descent + 2 * stroke_width
+    return math.ceil(text_width), math.ceil(text_height)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_line_width(line: str, font: ImageFont.FreeTypeFont) -> float:
+    """
+    Get the width of a single line of text with the given font.
+
+    Glyphs such as a serif "f" may draw past their advance width, so the right edge of the ink is also considered.
     """
-    left, top, right, bottom = font.getbbox(text)
-    text_width = round(right - left)
-    text_height = round(bottom - top)
-    return text_width, text_height * text.count("\n") + 2 * text_height
+    return max(font.getlength(line), font.getbbox(line)[2])
 
 
 def _draw_text_image(
@@ -285,9 +342,9 @@ def _draw_text_image(
     align: str,
     stroke_color: str,
     stroke_width: float,
-) -> Image.Image:
+) -> np.ndarray:
     """
-    Create an image with the given text and font.
+    Create an RGBA image array with the given text and font.
     """
     text_image = Image.new("RGBA", text_size, (255, 255, 255, 0))
     text_draw = ImageDraw.Draw(text_image)
@@ -304,40 +361,112 @@ def _draw_text_image(
         spacing=line_height,
     )
 
-    return text_image
+    return np.asarray(text_image)
+
+
+@functools.lru_cache(maxsize=64)
+def _get_shadow_offset(shadow_angle: float, shadow_distance: float) -> tuple[int, int]:
+    """
+    Get the shadow offset in pixels for the given angle and distance.
+
+    Offsets are cached, since projects usually share a handful of shadow settings across all text clips.
+    """
+    x_offset = round(shadow_distance * math.cos(math.radians(shadow_angle)))
+    y_offset = round(shadow_distance * math.sin(math.radians(shadow_angle)))
+    return x_offset, y_offset
 
 
 def _draw_text_shadow_image(
     text: str,
-    text_size: tuple[int, int],
     font: ImageFont.FreeTypeFont,
     line_height: int,
     align: str,
     shadow_color: str,
-    shadow_angle: float,
-    shadow_distance: float,
     shadow_blur: float,
     shadow_opacity: float,
-) -> Image.Image:
+    canvas_size: tuple[int, int],
+    position: tuple[int, int],
+) -> np.ndarray:
     """
-    Apply shadow to the text with angle and distance offset.
+    Create an RGBA image array with the text shadow drawn at the given position of the canvas.
+
+    Only the alpha channel carries the shadow shape, so it is drawn, blurred and scaled as a single
+    channel image, and the shadow color is only filled in at the end.
     """
-    x_offset = round(shadow_distance * math.cos(math.radians(shadow_angle)))
-    y_offset = round(shadow_distance * math.sin(math.radians(shadow_angle)))
+    red, green, blue, alpha = ImageColor.getcolor(shadow_color, "RGBA")  # type: ignore[misc]
 
-    # Expand shadow image size to accommodate offset
-    shadow_width = text_size[0] + abs(x_offset)
-    shadow_height = text_size[1] + abs(y_offset)
-    shadow_image = Image.new("RGBA", (shadow_width, shadow_height), (0, 0, 0, 0))
-    shadow_draw = ImageDraw.Draw(shadow_image)
+    shadow_mask = Image.new("L", canvas_size, 0)
+    shadow_draw = ImageDraw.Draw(shadow_mask)
     shadow_draw.multiline_text(
-        (x_offset, y_offset),
+        position,
         text,
         font=font,
-        fill=shadow_color,
+        fill=alpha,
         spacing=line_height,
         align=align,
     )
-    shadow_image = shadow_image.filter(ImageFilter.GaussianBlur(radius=shadow_blur))
-    shadow_image = Image.blend(Image.new("RGBA", shadow_image.size, (0, 0, 0, 0)), shadow_image, shadow_opacity)
-    return shadow_image
+    shadow_alpha = np.array(shadow_mask)
+
+    if shadow_blur > 0:
+        shadow_alpha = cv.GaussianBlur(shadow_alpha, (0, 0), sigmaX=shadow_blur)
+
+    if shadow_opacity < 1:
+        np.multiply(shadow_alpha, shadow_opacity, out=shadow_alpha, casting="unsafe")
+
+    shadow_array = np.empty((*shadow_alpha.shape, 4), dtype=np.uint8)
+    shadow_array[..., :3] = (red, green, blue)
+    shadow_array[..., 3] = shadow_alpha
+
+    return shadow_array
+
+
+def _alpha_composite(background: np.ndarray, foreground: np.ndarray, position: tuple[int, int] = (0, 0)) -> np.ndarray:
+    """
+    Composite the foreground RGBA array over the background RGBA array, at the given (x, y) position.
+    """
+    x, y = position
+    height, width = foreground.shape[:2]
+    region = (slice(y, y + height), slice(x, x + width))
+    result = background.copy()
+
+    fg = foreground.astype(np.float32) / 255
+    bg = result[region].astype(np.float32) / 255
+    fg_alpha = fg[..., 3:]
+    bg_alpha = bg[..., 3:] * (1 - fg_alpha)
+    out_alpha = fg_alpha + bg_alpha
+    out_rgb = np.divide(
+        fg[..., :3] * fg_alpha + bg[..., :3] * bg_alpha,
+        out_alpha,
+        out=np.zeros_like(fg[..., :3]),
+        where=out_alpha > 0,
+    )
+
+    result[region] = np.rint(np.concatenate((out_rgb, out_alpha), axis=-1) * 255).astype(np.uint8)
+    return result
+
+
+def _get_content_bbox(image: np.ndarray) -> tuple[int, int, int, int] | None:
+    """
+    Get the (left, top, right, bottom) bounding box of the non-transparent pixels of the RGBA array.
+    """
+    alpha = image[..., 3]
+    rows = np.flatnonzero(alpha.any(axis=1))
+
+    if rows.size == 0:
+        return None
+
+    cols = np.flatnonzero(alpha.any(axis=0))
+    return int(cols[0]), int(rows[0]), int(cols[-1]) + 1, int(rows[-1]) + 1
+
+
+def _crop_to_content(image: np.ndarray) -> np.ndarray:
+    """
+    Crop the RGBA array to the bounding box of its non-transparent pixels.
+    """
+    bbox = _get_content_bbox(image)
+
+    if bbox is None:
+        return image
+
+    left, top, right, bottom = bbox
+    return image[top:bottom, left:right]
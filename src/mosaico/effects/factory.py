@@ -1,3 +1,5 @@
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Any
 
 from mosaico.effects.crossfade import CrossFadeInEffect, CrossFadeOutEffect
@@ -7,25 +9,30 @@ from mosaico.effects.protocol import Effect
 from mosaico.effects.zoom import ZoomInEffect, ZoomOutEffect
 
 
-EFFECT_MAP: dict[str, type[Effect]] = {
-    "pan_left": PanLeftEffect,
-    "pan_right": PanRightEffect,
-    "pan_up": PanUpEffect,
-    "pan_down": PanDownEffect,
-    "zoom_in": ZoomInEffect,
-    "zoom_out": ZoomOutEffect,
-    "fade_in": FadeInEffect,
-    "fade_out": FadeOutEffect,
-    "crossfade_in": CrossFadeInEffect,
-    "crossfade_out": CrossFadeOutEffect,
-}
-
-
-def create_effect(effect_type: str, **params: Any) -> Effect:
+EFFECT_MAP: Mapping[str, type[Effect]] = MappingProxyType(
+    {
+        "pan_left": PanLeftEffect,
+        "pan_right": PanRightEffect,
+        "pan_up": PanUpEffect,
+        "pan_down": PanDownEffect,
+        "zoom_in": ZoomInEffect,
+        "zoom_out": ZoomOutEffect,
+        "fade_in": FadeInEffect,
+        "fade_out": FadeOutEffect,
+        "crossfade_in": CrossFadeInEffect,
+        "crossfade_out": CrossFadeOutEffect,
+    }
+)
+"""Read-only mapping of effect types to effect classes."""
+
+
+def create_effect(effect_type: str, *, validate: bool = True, **params: Any) -> Effect:
     """
     Create an effect.
 
     :param effect_type: The type of the effect.
+    :param validate: Whether to validate the effect parameters. Only disable it for trusted parameters,
+        as no type coercion or validation rules will run.
     :param params: The effect parameters.
     :return: The effect.
     """
@@ -34,4 +41,7 @@ def create_effect(effect_type: str, **params: Any) -> Effect:
     if effect_cls is None:
         raise ValueError(f"Invalid effect type: {effect_type}")
 
+    if not validate:
+        return effect_cls.model_construct(**params)  # type: ignore
+
     return effect_cls(**params)
@@ -46,8 +46,12 @@ class PanRightEffect(BasePanEffect):
     """Effect type. Must be "pan_right"."""
 
     def _pan_fn(self, clip: VideoClip) -> PanFn:
+        # Resolve the pan span once, as the pan function is called for every frame
+        span = clip.w * self.zoom_factor - clip.w
+        duration = clip.duration
+
         def pan(t):
-            x = (clip.w * self.zoom_factor - clip.w) * (t / clip.duration)
+            x = span * (t / duration)
             return (-x, "center")
 
         return pan
@@ -60,8 +64,11 @@ class PanLeftEffect(BasePanEffect):
     """Effect type. Must be "pan_left"."""
 
     def _pan_fn(self, clip: VideoClip) -> PanFn:
+        span = clip.w * self.zoom_factor - clip.w
+        duration = clip.duration
+
         def pan(t):
-            x = (clip.w * self.zoom_factor - clip.w) * (1 - t / clip.duration)
+            x = span * (1 - t / duration)
             return (-x, "center")
 
         return pan
@@ -74,8 +81,11 @@ class PanDownEffect(BasePanEffect):
     """Effect type. Must be "pan_down"."""
 
     def _pan_fn(self, clip: VideoClip) -> PanFn:
+        span = clip.h * self.zoom_factor - clip.h
+        duration = clip.duration
+
         def pan(t):
-            y = (clip.h * self.zoom_factor - clip.h) * (t / clip.duration)
+            y = span * (t / duration)
             return ("center", -y)
 
         return pan
@@ -88,8 +98,11 @@ class PanUpEffect(BasePanEffect):
     """Effect type. Must be "pan_up"."""
 
     def _pan_fn(self, clip: VideoClip) -> PanFn:
+        span = clip.h * self.zoom_factor - clip.h
+        duration = clip.duration
+
         def pan(t):
-            y = (clip.h * self.zoom_factor - clip.h) * (1 - t / clip.duration)
+            y = span * (1 - t / duration)
             return ("center", -y)
 
         return pan
@@ -1,4 +1,6 @@
-from typing import Literal
+from typing import Annotated, Literal
+
+from pydantic.fields import Field
 
 from mosaico.effects.crossfade import CrossFadeInEffect, CrossFadeOutEffect
 from mosaico.effects.fade import FadeInEffect, FadeOutEffect
@@ -6,7 +8,7 @@ from mosaico.effects.pan import PanDownEffect, PanLeftEffect, PanRightEffect, Pa
 from mosaico.effects.zoom import ZoomInEffect, ZoomOutEffect
 
 
-VideoEffect = (
+VideoEffect = Annotated[
     ZoomInEffect
     | ZoomOutEffect
     | PanLeftEffect
@@ -16,9 +18,10 @@ VideoEffect = (
     | FadeInEffect
     | FadeOutEffect
     | CrossFadeInEffect
-    | CrossFadeOutEffect
-)
-"""A type representing any video effect."""
+    | CrossFadeOutEffect,
+    Field(discriminator="type"),
+]
+"""A type representing any video effect, discriminated by its type."""
 
 VideoEffectType = Literal[
     "zoom_in",
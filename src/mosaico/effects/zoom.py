@@ -24,11 +24,14 @@ class BaseZoomEffect(BaseModel):
         :param clip: The clip to apply the effect to.
         :return: The clip with the effect applied.
         """
+        # Resolve the zoom range once, as the zoom function is called for every frame
+        start_zoom = self.start_zoom
+        zoom_span = self.end_zoom - self.start_zoom
+        duration = clip.duration
 
         def zoom(t):
             """Calculate zoom factor at time t."""
-            progress = t / clip.duration
-            return self.start_zoom + (self.end_zoom - self.start_zoom) * progress
+            return start_zoom + zoom_span * (t / duration)
 
         return clip.with_effects([vfx.Resize(zoom)])  # type: ignore
 
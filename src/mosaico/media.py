@@ -3,8 +3,10 @@ from __future__ import annotations
 import base64
 import binascii
 import contextlib
+import functools
 import io
 import mimetypes
+import os
 import re
 import uuid
 from collections.abc import Generator
@@ -26,6 +28,9 @@ from mosaico.types import FilePath
 
 _BASE64_BYTE_PATTERN = re.compile(rb"^[A-Za-z0-9+/]+={0,2}$")
 
+_LOCAL_READ_BUFFER_SIZE = 1 << 20
+"""Buffer size used to stream local media files (1 MiB)."""
+
 
 class Media(BaseModel):
     """
@@ -153,7 +158,7 @@ class Media(BaseModel):
         :return: The media.
         """
         if not mime_type and guess_mime_type:
-            mime_type = mimetypes.guess_type(str(path))[0]
+            mime_type = _guess_mime_type(os.fspath(path))
 
         return cls(
             data=None,
@@ -228,6 +233,11 @@ class Media(BaseModel):
         if isinstance(self.data, str):
             return self.data.encode(self.encoding)
         if self.data is None and self.path is not None:
+            local_path = self._get_local_path()
+            if local_path is not None and not kwargs:
+                # Plain local files are read in a single call, without going through fsspec
+                with open(local_path, "rb") as f:
+                    return f.read()
             kwargs["mode"] = "rb"
             with self.open(**kwargs) as f:
                 return cast(bytes, f.read())
@@ -238,14 +248,21 @@ class Media(BaseModel):
         """
         Read data as a byte stream.
         """
+        # BytesIO shares the buffer of the bytes it is created from until it is written to,
+        # so wrapping the data does not copy it.
         if isinstance(self.data, bytes):
             yield io.BytesIO(self.data)
         elif isinstance(self.data, str):
             yield io.BytesIO(self.data.encode(self.encoding))
         elif self.data is None and self.path:
-            kwargs["mode"] = "rb"
-            with self.open(**kwargs) as f:
-                yield cast(IO[bytes], f)
+            local_path = self._get_local_path()
+            if local_path is not None and not kwargs:
+                with open(local_path, "rb", buffering=_LOCAL_READ_BUFFER_SIZE) as f:
+                    yield f
+            else:
+                kwargs["mode"] = "rb"
+                with self.open(**kwargs) as f:
+                    yield cast(IO[bytes], f)
         else:
             raise NotImplementedError(f"Unable to convert blob {self}")
 
@@ -260,6 +277,19 @@ class Media(BaseModel):
         with fs.open(path_str, **kwargs) as f:
             yield f
 
+    def _get_local_path(self) -> str | None:
+        """
+        Returns the media path if it is a plain local file path, or None if it is an fsspec URL.
+
+        A leading "~" is expanded to the home directory, as fsspec does for local paths.
+        """
+        if self.path is None:
+            return None
+        path = os.fspath(self.path)
+        if "://" in path or "::" in path:
+            return None
+        return os.path.expanduser(path)
+
     def add_metadata(self, metadata: dict[str, Any]) -> Self:
         """
         Add metadata to the media object.
@@ -280,3 +310,22 @@ class Media(BaseModel):
         """
         self.storage_options = storage_options
         return self
+
+
+def _guess_mime_type(path: str) -> str | None:
+    """
+    Guesses the MIME type of a path, caching the guess by file extension for plain file paths.
+    """
+    extension = os.path.splitext(path)[1]
+    # URLs and compressed files need the whole path to be guessed
+    if ":" in path or extension in mimetypes.encodings_map:
+        return mimetypes.guess_type(path)[0]
+    return _guess_mime_type_from_extension(extension)
+
+
+@functools.lru_cache(maxsize=64)
+def _guess_mime_type_from_extension(extension: str) -> str | None:
+    """
+    Guesses the MIME type of a file extension.
+    """
+    return mimetypes.guess_type(f"media{extension}")[0]
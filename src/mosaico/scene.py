@@ -33,12 +33,10 @@ class Scene(BaseModel):
         :param data: The dictionary data.
         :return: The scene.
         """
-        asset_refs = []
-
-        for asset_ref in data.get("asset_references", []):
-            if isinstance(asset_ref, Mapping):
-                asset_ref = AssetReference.from_dict(asset_ref)
-            asset_refs.append(asset_ref)
+        asset_refs = [
+            AssetReference.from_dict(asset_ref) if isinstance(asset_ref, Mapping) else asset_ref
+            for asset_ref in data.get("asset_references", ())
+        ]
 
         return cls(
             title=data.get("title"),
@@ -103,7 +101,8 @@ class Scene(BaseModel):
         :param asset_id: The asset ID to remove.
         :return: The scene.
         """
-        self.asset_references = [ref for ref in self.asset_references if ref.asset_id != asset_id]
+        # Filter in place, as assigning the field would revalidate every remaining reference
+        self.asset_references[:] = [ref for ref in self.asset_references if ref.asset_id != asset_id]
         return self
 
     def with_subtitle_params(self, params: TextAssetParams | Mapping[str, Any]) -> Scene:
@@ -1,25 +1,31 @@
 import textwrap
 
 
+# Prompts keep their instructions, guidelines and examples ahead of the values formatted into them, so repeated
+# requests share a token-identical prefix that providers with prompt caching can reuse.
+
 SUMMARIZE_CONTEXT_PROMPT = textwrap.dedent(
     """
     INSTRUCTIONS:
-    You are a helpful news assistant tasked with summarizing the key points of the following context for a journalist
+    You are a helpful news assistant tasked with summarizing the key points of the context below for a journalist
     in paragraphs. Your summary should be very concise, informative, and capture the most important details of the
     context. The summary will be used by the journalist to produce a self-contained shooting script for an informative
     video based on the context provided.
 
-    CONTEXT:
-    {context}
-
     OUTPUT GUIDELINES:
-    - The summary should have {num_paragraphs} short paragraphs.
+    - The summary should have the number of paragraphs given below.
     - Each paragraph should be a very short sentence.
     - Adhere to the best practices of journalistic writing.
     - Make the paragraphs follow the chronology of the context.
     - Make sure the first paragraph is the lead of the story.
     - Make sure the last paragraph is the conclusion of the story.
-    - Return only the paragraphs in {language} without any additional information.
+    - Return only the paragraphs in the language given below without any additional information.
+
+    NUMBER OF PARAGRAPHS: {num_paragraphs}
+    LANGUAGE: {language}
+
+    CONTEXT:
+    {context}
 
     SUMMARY:
     """
@@ -36,12 +42,6 @@ MEDIA_SUGGESTING_PROMPT = textwrap.dedent(
     create a compelling visual narrative. Make sure each suggested media object is thoughtfully integrated to enhance
     the narrative flow.
 
-    AVAILABLE MEDIA OBJECTS:
-    {media_objects}
-
-    PARAGRAPHS:
-    {paragraphs}
-
     OUTPUT GUIDELINES:
     - Suggest media objects for each paragraph. Try to use as many as possible.
     - The video should be dynamic, so be sure to select different media objects for different shots.
@@ -70,6 +70,12 @@ MEDIA_SUGGESTING_PROMPT = textwrap.dedent(
         ]
     }}
 
+    AVAILABLE MEDIA OBJECTS:
+    {media_objects}
+
+    PARAGRAPHS:
+    {paragraphs}
+
     SUGGESTIONS:
     """
 ).strip()
@@ -78,12 +84,9 @@ SHOOTING_SCRIPT_PROMPT = textwrap.dedent(
     """
     INSTRUCTIONS:
     You are an experienced video editor tasked with creating a shooting script for an informative video based on the
-    following paragraphs and media objects. Your script should suggest effects and timings for the media objects to
+    paragraphs and media objects below. Your script should suggest effects and timings for the media objects to
     create a visually engaging video.
 
-    PARAGRAPHS AND MEDIA OBJECTS SUGGESTIONS:
-    {suggestions}
-
     OUTPUT GUIDELINES:
     - Keep the paragraphs and media objects as they are. Avoid changing them.
     - Use the paragraphs as subtitles for the shots.
@@ -93,6 +96,9 @@ SHOOTING_SCRIPT_PROMPT = textwrap.dedent(
     - Avoid using fade and crossfade effects and transitions.
     - Respond only with the structured JSON output format in the same language as the paragraphs.
 
+    PARAGRAPHS AND MEDIA OBJECTS SUGGESTIONS:
+    {suggestions}
+
     SHOOTING SCRIPT:
     """
 ).strip()
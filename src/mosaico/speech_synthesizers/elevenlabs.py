@@ -1,15 +1,17 @@
-import io
 import os
+import threading
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Any, ClassVar, Literal
 
 import requests
 from pydantic import BaseModel
 from pydantic.fields import Field
+from pydantic.types import PositiveInt
 from pydantic_extra_types.language_code import LanguageAlpha2
-from pydub import AudioSegment
 
-from mosaico.assets.audio import AudioAsset, AudioAssetParams, AudioInfo
+from mosaico.assets.audio import AudioAsset, AudioAssetParams
+from mosaico.speech_synthesizers.utils import get_mp3_speech_info
 
 
 class ElevenLabsSpeechSynthesizer(BaseModel):
@@ -58,6 +60,10 @@ class ElevenLabsSpeechSynthesizer(BaseModel):
     timeout: int = 120
     """Timeout for the HTTP request in seconds."""
 
+    max_concurrency: PositiveInt = 1
+    """Maximum number of speech synthesis requests sent concurrently. With more than one, requests are not
+    stitched to the previous requests, and only the surrounding texts are used for continuity."""
+
     def synthesize(
         self, texts: Sequence[str], *, audio_params: AudioAssetParams | None = None, **kwargs: Any
     ) -> list[AudioAsset]:
@@ -69,37 +75,65 @@ class ElevenLabsSpeechSynthesizer(BaseModel):
         :param kwargs: Additional keyword arguments.
         :return: List of synthesized audio assets.
         """
+        if self.max_concurrency > 1:
+            responses = self._fetch_speech_syntheses_concurrently(texts)
+        else:
+            responses = []
+            previous_request_ids = []
+            # Requests are sent through a single session, keeping the connection to the API alive
+            with requests.Session() as session:
+                for i, text in enumerate(texts):
+                    response = self._fetch_speech_synthesis(
+                        session, text, previous_request_ids[-3:], *_get_surrounding_texts(texts, i)
+                    )
+                    previous_request_ids.append(response.headers["request-id"])
+                    responses.append(response)
+
         assets = []
-        previous_request_ids = []
-
-        for i, text in enumerate(texts):
-            is_first = i == 0
-            is_last = i == len(texts) - 1
-            response = self._fetch_speech_synthesis(
-                text=text,
-                previous_request_ids=previous_request_ids[-3:],
-                previous_text=None if is_first else " ".join(texts[:i]),
-                next_text=None if is_last else " ".join(texts[i + 1 :]),
-            )
-            previous_request_ids.append(response.headers["request-id"])
-            duration = AudioSegment.from_file(io.BytesIO(response.content), format="mp3").duration_seconds
+
+        for text, response in zip(texts, responses):
             asset = AudioAsset.from_data(
                 response.content,
                 params=audio_params if audio_params is not None else {},
                 mime_type="audio/mpeg",
-                info=AudioInfo(
-                    duration=duration,
-                    sample_rate=44100,
-                    sample_width=128,
-                    channels=1,
-                ),
+                info=get_mp3_speech_info(response.content, text),
             )
             assets.append(asset)
 
         return assets
 
+    def _fetch_speech_syntheses_concurrently(self, texts: Sequence[str]) -> list[requests.Response]:
+        """
+        Fetches the speech syntheses of the given texts from the ElevenLabs API concurrently, keeping their order.
+
+        Request stitching needs the IDs of previous requests, so concurrent requests rely on the surrounding texts
+        alone for continuity. Sessions are not thread-safe, so each worker thread sends its requests through its
+        own session, closed once every text is synthesized.
+        """
+        sessions: list[requests.Session] = []
+        thread_local = threading.local()
+
+        def fetch_speech_synthesis(text: str, previous_text: str | None, next_text: str | None) -> requests.Response:
+            session = getattr(thread_local, "session", None)
+            if session is None:
+                session = thread_local.session = requests.Session()
+                sessions.append(session)
+            return self._fetch_speech_synthesis(session, text, [], previous_text, next_text)
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="mosaico-tts") as executor:
+                futures = [
+                    executor.submit(fetch_speech_synthesis, text, *_get_surrounding_texts(texts, i))
+                    for i, text in enumerate(texts)
+                ]
+                return [future.result() for future in futures]
+        finally:
+            for session in sessions:
+                session.close()
+
     def _fetch_speech_synthesis(
         self,
+        session: requests.Session,
         text: str,
         previous_request_ids: Sequence[str],
         previous_text: str | None = None,
@@ -108,7 +142,7 @@ class ElevenLabsSpeechSynthesizer(BaseModel):
         """
         Fetches the speech synthesis from the ElevenLabs API.
         """
-        response = requests.post(
+        response = session.post(
             f"https://api.elevenlabs.io/v1/text-to-speech/{self.voice_id}/stream",
             json={
                 "text": text,
@@ -129,3 +163,12 @@ class ElevenLabsSpeechSynthesizer(BaseModel):
         )
         response.raise_for_status()
         return response
+
+
+def _get_surrounding_texts(texts: Sequence[str], index: int) -> tuple[str | None, str | None]:
+    """
+    Get the texts before and after the text at the given index, used as context for its synthesis.
+    """
+    previous_text = " ".join(texts[:index]) if index > 0 else None
+    next_text = " ".join(texts[index + 1 :]) if index < len(texts) - 1 else None
+    return previous_text, next_text
@@ -1,15 +1,16 @@
-import io
+import functools
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from typing import Annotated, Any, ClassVar, Literal
 
 from pydantic import BaseModel
 from pydantic.fields import Field, PrivateAttr
 from pydantic.functional_validators import model_validator
 from pydantic.types import PositiveInt
-from pydub import AudioSegment
 from typing_extensions import Self
 
-from mosaico.assets.audio import AudioAsset, AudioAssetParams, AudioInfo
+from mosaico.assets.audio import AudioAsset, AudioAssetParams
+from mosaico.speech_synthesizers.utils import get_mp3_speech_info
 
 
 OpenAITTSVoice = Literal["alloy", "ash", "ballad", "echo", "coral", "fable", "onyx", "nova", "sage", "shimmer", "verse"]
@@ -49,6 +50,9 @@ class OpenAISpeechSynthesizer(BaseModel):
     silence_duration: float | None = None
     """Silence duration for the audio asset."""
 
+    max_concurrency: PositiveInt = 8
+    """Maximum number of speech synthesis requests sent concurrently."""
+
     _client: Any = PrivateAttr(default=None)
     """The OpenAI client."""
 
@@ -84,8 +88,6 @@ class OpenAISpeechSynthesizer(BaseModel):
         :param kwargs: Additional parameters for the OpenAI API.
         :return: List of audio assets.
         """
-        assets = []
-
         model = kwargs.pop("model", self.model)
         instructions = kwargs.pop("instructions", self.instructions)
         silence_threshold = kwargs.pop("silence_threshold", self.silence_threshold)
@@ -94,32 +96,50 @@ class OpenAISpeechSynthesizer(BaseModel):
         if instructions and model.startswith("tts-"):
             raise ValueError("`instructions` cannot be set when model is not from the GPT-4o family or higher.")
 
-        for text in texts:
-            response = self._client.audio.speech.create(
-                input=text,
-                model=model,
-                instructions=instructions,
-                voice=kwargs.pop("voice", self.voice),
-                speed=kwargs.pop("speed", self.speed),
-                response_format="mp3",
-                **kwargs,
-            )
-            segment = AudioSegment.from_file(io.BytesIO(response.content), format="mp3")
-            asset = AudioAsset.from_data(
-                response.content,
-                params=audio_params if audio_params is not None else {},
-                mime_type="audio/mpeg",
-                info=AudioInfo(
-                    duration=segment.duration_seconds,
-                    sample_rate=segment.frame_rate,
-                    sample_width=segment.sample_width,
-                    channels=segment.channels,
-                ),
-            )
-
-            if silence_threshold is not None and silence_duration is not None:
-                asset = asset.strip_silence(silence_threshold, silence_duration)
-
-            assets.append(asset)
-
-        return assets
+        synthesize_text = functools.partial(
+            self._synthesize_text,
+            audio_params=audio_params,
+            silence_threshold=silence_threshold,
+            silence_duration=silence_duration,
+            model=model,
+            instructions=instructions,
+            voice=kwargs.pop("voice", self.voice),
+            speed=kwargs.pop("speed", self.speed),
+            **kwargs,
+        )
+
+        # Requests are independent and network-bound, so they are sent concurrently, keeping the texts order
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix="mosaico-tts") as executor:
+            return list(executor.map(synthesize_text, texts))
+
+    def _synthesize_text(
+        self,
+        text: str,
+        *,
+        audio_params: AudioAssetParams | None,
+        silence_threshold: float | None,
+        silence_duration: float | None,
+        **kwargs: Any,
+    ) -> AudioAsset:
+        """
+        Synthesize speech from a single text using OpenAI's API.
+
+        :param text: Text to synthesize.
+        :param audio_params: Parameters for the audio asset.
+        :param silence_threshold: Silence threshold for the audio asset.
+        :param silence_duration: Silence duration for the audio asset.
+        :param kwargs: Parameters for the OpenAI API.
+        :return: The audio asset.
+        """
+        response = self._client.audio.speech.create(input=text, response_format="mp3", **kwargs)
+        asset = AudioAsset.from_data(
+            response.content,
+            params=audio_params if audio_params is not None else {},
+            mime_type="audio/mpeg",
+            info=get_mp3_speech_info(response.content, text),
+        )
+
+        if silence_threshold is not None and silence_duration is not None:
+            asset = asset.strip_silence(silence_threshold, silence_duration)
+
+        return asset
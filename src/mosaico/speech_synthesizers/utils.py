@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import io
+
+from pydub import AudioSegment
+from tinytag import TinyTag, TinyTagException
+
+from mosaico.assets.audio import AudioInfo
+
+
+_SAMPLE_FORMAT_DECODE_DURATION = 0.1
+"""Duration, in seconds, of the speech decoded to read its sample format."""
+
+
+def get_mp3_speech_info(audio: bytes, text: str) -> AudioInfo:
+    """
+    Get the audio info of speech synthesized in MP3 format.
+
+    The duration is read from the MP3 headers and the sample format from the first milliseconds of the decoded
+    audio, so the speech is never decoded as a whole.
+
+    :param audio: The MP3 audio data.
+    :param text: The text the speech was synthesized from.
+    :return: The audio info.
+    :raises ValueError: If the duration of the speech cannot be read.
+    """
+    try:
+        duration = TinyTag.get(file_obj=io.BytesIO(audio)).duration
+    except TinyTagException as e:
+        raise ValueError(f"Could not read the MP3 speech synthesized from text: {text!r}") from e
+
+    if not duration:
+        raise ValueError(f"Could not read the duration of the MP3 speech synthesized from text: {text!r}")
+
+    # The decoder is given, so pydub does not probe the audio before decoding it
+    segment = AudioSegment.from_file(
+        io.BytesIO(audio), format="mp3", codec="mp3", duration=_SAMPLE_FORMAT_DECODE_DURATION
+    )
+
+    return AudioInfo(
+        duration=duration,
+        sample_rate=segment.frame_rate,
+        sample_width=segment.sample_width,
+        channels=segment.channels,
+    )
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from collections.abc import Mapping, Sequence
+from collections.abc import Mapping, Sequence, Set
 from pathlib import Path
 from typing import Any, cast
 
@@ -35,6 +35,13 @@ from mosaico.video.types import AssetInputType, TimelineEvent
 
 logger = get_logger(__name__)
 
+_NUMBER_PATTERN = re.compile(r"\d+(?:[.,]\d+)*")
+_NUMBER_SEPARATORS = frozenset({",", "."})
+
+# LibYAML bindings parse and emit YAML several times faster than the pure Python implementation
+_YAML_LOADER: type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: type[yaml.SafeDumper] = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class VideoProjectConfig(BaseModel):
     """A dictionary representing the configuration of a project."""
@@ -51,7 +58,7 @@ class VideoProjectConfig(BaseModel):
     fps: PositiveInt = 30
     """The frames per second of the project. Defaults to 30."""
 
-    model_config = ConfigDict(validate_assignment=True, extra="ignore")
+    model_config = ConfigDict(validate_assignment=True, extra="ignore", defer_build=True)
 
 
 class VideoProject(BaseModel):
@@ -69,7 +76,7 @@ class VideoProject(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
     """The metadata of the video project."""
 
-    model_config = ConfigDict(validate_assignment=True)
+    model_config = ConfigDict(defer_build=True)
 
     @property
     def duration(self) -> float:
@@ -106,12 +113,12 @@ class VideoProject(BaseModel):
         :return: A Project object instance.
         """
         if isinstance(file, (str, Path)):
-            project_str = Path(file).read_text(encoding="utf-8")
+            with open(file, "rb") as f:
+                project_dict = yaml.load(f, Loader=_YAML_LOADER)
         else:
             file.seek(0)
-            project_str = file.read()
+            project_dict = yaml.load(file, Loader=_YAML_LOADER)
 
-        project_dict = yaml.safe_load(project_str)
         return cls.from_dict(project_dict)
 
     @classmethod
@@ -138,46 +145,51 @@ class VideoProject(BaseModel):
         # Generate assets and scenes from a scene generator.
         script = script_generator.generate(media, **kwargs)
 
+        # Index media by ID to look up media references in constant time, keeping the first of duplicate IDs.
+        media_by_id = {m.id: m for m in reversed(media)}
+        media_assets: dict[str, Asset] = {}
+
         # Create assets and scenes from the script.
+        assets: list[Asset] = []
+        scenes = []
         for shot in script.shots:
             # Create subtitle asset
             shot_subtitle = SubtitleAsset.from_data(shot.subtitle)
 
             # Create scene with initial subtitle reference
             scene = Scene(description=shot.description).add_asset_references(
-                AssetReference.from_asset(shot_subtitle).with_start_time(shot.start_time).with_end_time(shot.end_time)
+                AssetReference.from_asset(shot_subtitle, start_time=shot.start_time, end_time=shot.end_time)
             )
 
-            # Add subtitle asset to project
-            project = project.add_assets(shot_subtitle)
+            assets.append(shot_subtitle)
 
             # Process each media reference in the shot
             for media_ref in shot.media_references:
-                # Find the referenced media
-                referenced_media = next(m for m in media if m.id == media_ref.media_id)
-
-                # Convert media to asset
-                media_asset = convert_media_to_asset(referenced_media)
+                # Convert the referenced media to an asset, once per media shared between shots
+                media_asset = media_assets.get(media_ref.media_id)
+                if media_asset is None:
+                    media_asset = convert_media_to_asset(media_by_id[media_ref.media_id])
+                    media_assets[media_ref.media_id] = media_asset
+                    assets.append(media_asset)
 
                 # Create asset reference with timing and effects
-                asset_ref = (
-                    AssetReference.from_asset(media_asset)
-                    .with_start_time(media_ref.start_time)
-                    .with_end_time(media_ref.end_time)
+                asset_ref = AssetReference.from_asset(
+                    media_asset, start_time=media_ref.start_time, end_time=media_ref.end_time
                 )
 
                 # Add effects if it's an image asset
                 if media_asset.type == "image" and media_ref.effects:
-                    asset_ref = asset_ref.with_effects([create_effect(effect) for effect in media_ref.effects])
+                    asset_ref = asset_ref.with_effects(
+                        [create_effect(effect, validate=False) for effect in media_ref.effects]
+                    )
 
-                # Add media asset and its reference to the scene
-                project = project.add_assets(media_asset)
+                # Add media asset reference to the scene
                 scene = scene.add_asset_references(asset_ref)
 
-            # Add completed scene to project timeline
-            project = project.add_timeline_events(scene)
+            scenes.append(scene)
 
-        return project
+        # Add the assets and completed scenes to the project at once, so the timeline is sorted a single time
+        return project.add_assets(assets).add_timeline_events(scenes)
 
     def to_file(self, file: FilePath | WritableBuffer[str]) -> None:
         """
@@ -185,15 +197,19 @@ class VideoProject(BaseModel):
 
         :param file: The path to the YAML file.
         """
-        project = self.model_dump(exclude_none=True)
-        project["assets"] = {asset_id: asset.model_dump() for asset_id, asset in self.assets.items()}
-        project["timeline"] = [event.model_dump() for event in self.timeline]
-        project_yaml = yaml.safe_dump(project, allow_unicode=True, sort_keys=False)
-
+        # Assets and events are dumped on their own, keeping their None values, so they are left out of the project dump
+        project = self.model_dump(exclude={"assets", "timeline"}, exclude_none=True)
+        project = {
+            "config": project.pop("config"),
+            "assets": {asset_id: asset.model_dump() for asset_id, asset in self.assets.items()},
+            "timeline": [event.model_dump() for event in self.timeline],
+            **project,
+        }
         if isinstance(file, (str, Path)):
-            Path(file).write_text(project_yaml, encoding="utf-8")
+            with open(file, "w", encoding="utf-8") as f:
+                yaml.dump(project, f, Dumper=_YAML_DUMPER, allow_unicode=True, sort_keys=False)
         else:
-            file.write(project_yaml)
+            yaml.dump(project, file, Dumper=_YAML_DUMPER, allow_unicode=True, sort_keys=False)
 
     def add_assets(self, assets: AssetInputType) -> VideoProject:
         """
@@ -209,10 +225,6 @@ class VideoProject(BaseModel):
                 self.assets[asset.id] = asset
                 continue
 
-            if not isinstance(asset, Mapping):
-                msg = f"Invalid asset type: {type(asset)}"
-                raise ValueError(msg)
-
             if "type" not in asset:
                 self.assets.update({a.id: a for a in _process_asset_dicts(asset)})
                 continue
@@ -230,36 +242,18 @@ class VideoProject(BaseModel):
         :return: The updated project.
         :raises ValueError: If an asset referenced in the events does not exist in the project.
         """
+        # Convert all events first, so the timeline is only changed if every referenced asset exists
+        new_events = Timeline().add_events(events)
+        assets = self.assets
 
-        def validate_asset_id(asset_id: str) -> None:
-            """Helper to validate asset ID exists"""
-            if asset_id not in self.assets:
-                raise AssetNotFoundError(asset_id)
-
-        def validate_scene_assets(scene_event: Scene | Mapping[str, Any]) -> None:
-            """Helper to validate assets referenced in a scene"""
-            if isinstance(scene_event, Scene):
-                for ref in scene_event.asset_references:
-                    validate_asset_id(ref.asset_id)
-            else:
-                for ref in scene_event["asset_references"]:
-                    asset_id = ref.asset_id if isinstance(ref, AssetReference) else ref["asset_id"]
-                    validate_asset_id(asset_id)
-
-        _events = events if isinstance(events, Sequence) else [events]
+        for event in new_events:
+            refs = event.asset_references if isinstance(event, Scene) else (event,)
+            for ref in refs:
+                if ref.asset_id not in assets:
+                    raise AssetNotFoundError(ref.asset_id)
 
-        for event in _events:
-            if isinstance(event, Scene):
-                validate_scene_assets(event)
-            elif isinstance(event, AssetReference):
-                validate_asset_id(event.asset_id)
-            elif isinstance(event, Mapping):
-                if "asset_references" in event:
-                    validate_scene_assets(event)
-                else:
-                    validate_asset_id(event["asset_id"])
-
-        self.timeline = self.timeline.add_events(events).sort()
+        self.timeline.root.extend(new_events.root)
+        self.timeline.sort()
 
         return self
 
@@ -280,8 +274,8 @@ class VideoProject(BaseModel):
             if not isinstance(scene, Scene):
                 continue
 
-            # Get subtitle content from scene
-            subtitle_refs = [ref for ref in scene.asset_references if ref.asset_type == "subtitle"]
+            # Split scene references into subtitles, images and other assets
+            subtitle_refs, image_refs, other_refs = _split_scene_references(scene)
 
             if not subtitle_refs:
                 continue
@@ -301,11 +295,6 @@ class VideoProject(BaseModel):
             # Calculate total narration duration for this scene
             total_narration_duration = sum(narration.duration for narration in narration_assets)
 
-            # Get non-subtitle assets to adjust timing
-            non_subtitle_refs = [ref for ref in scene.asset_references if ref.asset_type != "subtitle"]
-            image_refs = [ref for ref in non_subtitle_refs if ref.asset_type == "image"]
-            other_refs = [ref for ref in non_subtitle_refs if ref.asset_type != "image"]
-
             if current_time is None:
                 current_time = scene.asset_references[0].start_time
 
@@ -318,36 +307,20 @@ class VideoProject(BaseModel):
                     logger.debug(f"Adjusting image {ref.asset_id} timing")
                     new_start = current_time + (idx * time_per_image)
                     new_end = new_start + time_per_image
-                    new_ref = ref.model_copy().with_start_time(new_start).with_end_time(new_end)
+                    new_ref = ref.model_copy(update={"start_time": new_start, "end_time": new_end})
                     new_refs.append(new_ref)
 
-            # Add other non-image assets with full narration duration
-            for ref in other_refs:
-                logger.debug(f"Adjusting non-image asset {ref.asset_id} timing")
-                new_ref = (
-                    ref.model_copy()
-                    .with_start_time(current_time)
-                    .with_end_time(current_time + total_narration_duration)
-                )
-                new_refs.append(new_ref)
-
-            # Add subtitle references spanning full narration duration
-            for ref in subtitle_refs:
-                logger.debug(f"Adjusting subtitle asset {ref.asset_id} timing")
-                new_ref = (
-                    ref.model_copy()
-                    .with_start_time(current_time)
-                    .with_end_time(current_time + total_narration_duration)
-                )
-                new_refs.append(new_ref)
+            # Add other non-image assets and subtitles spanning full narration duration
+            narration_span = {"start_time": current_time, "end_time": current_time + total_narration_duration}
+            for ref in (*other_refs, *subtitle_refs):
+                logger.debug(f"Adjusting {ref.asset_type} asset {ref.asset_id} timing")
+                new_refs.append(ref.model_copy(update=narration_span))
 
             # Add narration references
             for narration in narration_assets:
                 logger.debug(f"Adjusting narration asset {narration.id} timing")
-                narration_ref = (
-                    AssetReference.from_asset(narration)
-                    .with_start_time(current_time)
-                    .with_end_time(current_time + narration.duration)
+                narration_ref = AssetReference.from_asset(
+                    narration, start_time=current_time, end_time=current_time + narration.duration
                 )
                 new_refs.append(narration_ref)
 
@@ -399,9 +372,7 @@ class VideoProject(BaseModel):
 
             # Remove existing subtitles
             logger.debug(f"Removing existing subtitles from scene at index {scene_index}")
-            for ref in scene.asset_references:
-                if ref.asset_type == "subtitle":
-                    self.remove_asset(ref.asset_id)
+            self._remove_assets({ref.asset_id for ref in scene.asset_references if ref.asset_type == "subtitle"})
 
             if aligner is not None:
                 logger.debug(f"Aligning subtitles for scene at index {scene_index}")
@@ -419,6 +390,7 @@ class VideoProject(BaseModel):
 
             # Calculate time scale factor if needed
             current_time = scene.start_time
+            scene_end_time = scene.end_time
 
             for phrase_index, phrase in enumerate(phrases):
                 logger.debug(f"Processing phrase {phrase_index + 1} of {len(phrases)}")
@@ -432,10 +404,10 @@ class VideoProject(BaseModel):
                 end_time = start_time + phrase_duration
 
                 # Ensure we don't exceed scene bounds
-                end_time = min(end_time, scene.end_time)
+                end_time = min(end_time, scene_end_time)
 
                 if phrase_index == len(phrases) - 1:
-                    end_time = scene.end_time
+                    end_time = scene_end_time
 
                 subtitle_ref = AssetReference.from_asset(
                     asset=subtitle,
@@ -504,15 +476,17 @@ class VideoProject(BaseModel):
         :return: The updated project.
         """
         for i, event in enumerate(self.timeline):
-            if not isinstance(event, Scene) or not event.has_audio:
+            if not isinstance(event, Scene):
                 continue
 
-            subtitles = _extract_assets_from_scene(event, self.assets, "subtitle")
+            audio_refs = [ref for ref in event.asset_references if ref.asset_type == "audio"]
 
-            for asset_ref in event.asset_references:
-                if asset_ref.asset_type != "audio":
-                    continue
+            if not audio_refs:
+                continue
+
+            subtitles = _extract_assets_from_scene(event, self.assets, "subtitle")
 
+            for asset_ref in audio_refs:
                 audio_asset = self.get_asset(asset_ref.asset_id)
                 audio_asset = cast(AudioAsset, audio_asset)
                 audio_transcription = audio_transcriber.transcribe(audio_asset)
@@ -558,7 +532,7 @@ class VideoProject(BaseModel):
             if isinstance(event, Scene):
                 self.timeline[i].with_subtitle_params(params)
             elif isinstance(event, AssetReference):
-                self.timeline[i].asset_params = params
+                self.timeline[i].with_params(params)
 
         return self
 
@@ -621,11 +595,12 @@ class VideoProject(BaseModel):
 
         :param index: The index of the timeline event.
         :return: The TimelineEvent object.
-        :raises ValueError: If the index is out of range.
+        :raises TimelineEventNotFoundError: If the index is out of range.
         """
-        if abs(index) >= len(self.timeline):
-            raise TimelineEventNotFoundError
-        return self.timeline[index]
+        try:
+            return self.timeline[index]
+        except IndexError:
+            raise TimelineEventNotFoundError from None
 
     def remove_timeline_event(self, index: int) -> VideoProject:
         """
@@ -633,10 +608,12 @@ class VideoProject(BaseModel):
 
         :param index: The index of the timeline event to remove.
         :return: The updated project.
+        :raises TimelineEventNotFoundError: If the index is out of range.
         """
-        if abs(index) >= len(self.timeline):
-            raise TimelineEventNotFoundError
-        del self.timeline[index]
+        try:
+            del self.timeline[index]
+        except IndexError:
+            raise TimelineEventNotFoundError from None
         return self
 
     def remove_asset(self, asset_id: str) -> VideoProject:
@@ -646,16 +623,27 @@ class VideoProject(BaseModel):
         :param asset_id: The ID of the asset to remove.
         :return: The updated project.
         """
-        try:
-            for i, event in enumerate(self.timeline):
-                if isinstance(event, Scene):
-                    self.timeline[i] = event.remove_asset_id_references(asset_id)
-                elif isinstance(event, AssetReference) and event.asset_id == asset_id:
-                    self.remove_timeline_event(i)
-            del self.assets[asset_id]
-            return self
-        except KeyError:
-            raise AssetNotFoundError(asset_id) from None
+        if asset_id not in self.assets:
+            raise AssetNotFoundError(asset_id)
+        return self._remove_assets({asset_id})
+
+    def _remove_assets(self, asset_ids: Set[str]) -> VideoProject:
+        """
+        Remove assets and every reference to them from the project in a single pass over the timeline.
+        """
+        events = []
+        for event in self.timeline:
+            if isinstance(event, Scene):
+                event.asset_references[:] = [ref for ref in event.asset_references if ref.asset_id not in asset_ids]
+            elif event.asset_id in asset_ids:
+                continue
+            events.append(event)
+        self.timeline.root[:] = events
+
+        for asset_id in asset_ids:
+            self.assets.pop(asset_id, None)
+
+        return self
 
 
 def _process_asset_dicts(asset_data: Mapping[str, Any]) -> list[Asset]:
@@ -687,61 +675,50 @@ def _group_transcript_into_sentences(
 ) -> list[list[TranscriptionWord]]:
     """
     Group words into phrases based on the duration of the words.
-    """
-    phrases: list[list[TranscriptionWord]] = []
-    current_phrase: list[TranscriptionWord] = []
-    current_duration = 0.0
-    number_pattern = re.compile(r"\d+([.,]\d+)*")
 
-    def is_part_of_number(word: str) -> bool:
-        return bool(number_pattern.match(word)) or word in {",", "."}
+    Only the phrase boundaries are tracked while walking the words, and phrases are sliced at the end.
+    """
+    words = transcription.words
+    word_count = len(words)
+    durations = [word.end_time - word.start_time for word in words]
+    number_parts = [_is_part_of_number(word.text) for word in words]
 
+    boundaries: list[int] = []
+    phrase_start = 0
+    current_duration = 0.0
     i = 0
 
-    while i < len(transcription.words):
-        word = transcription.words[i]
-        word_duration = word.end_time - word.start_time
-
-        # Check if this word is part of a number
-        if is_part_of_number(word.text):
-            number_phrase = [word]
-            number_duration = word_duration
-            j = i + 1
-            while j < len(transcription.words) and is_part_of_number(transcription.words[j].text):
-                number_phrase.append(transcription.words[j])
-                number_duration += transcription.words[j].end_time - transcription.words[j].start_time
+    while i < word_count:
+        # Words that are part of a number are kept in the same phrase
+        j = i + 1
+        if number_parts[i]:
+            while j < word_count and number_parts[j]:
                 j += 1
+        group_duration = sum(durations[i:j])
 
-            # If adding the entire number would exceed max_duration, start a new phrase
-            if current_duration + number_duration > max_duration and current_phrase:
-                phrases.append(current_phrase)
-                current_phrase = []
-                current_duration = 0
-
-            current_phrase.extend(number_phrase)
-            current_duration += number_duration
-            i = j
-        else:
-            # Regular word processing
-            if current_duration + word_duration > max_duration and current_phrase:
-                phrases.append(current_phrase)
-                current_phrase = []
-                current_duration = 0
+        # If adding the word or the entire number would exceed max_duration, start a new phrase
+        if current_duration + group_duration > max_duration and i > phrase_start:
+            boundaries.append(i)
+            phrase_start = i
+            current_duration = 0
 
-            current_phrase.append(word)
-            current_duration += word_duration
-            i += 1
+        current_duration += group_duration
+        i = j
 
         # If we've reached max_duration or end of transcription, start a new phrase
-        if current_duration >= max_duration or i == len(transcription.words) and current_phrase:
-            phrases.append(current_phrase)
-            current_phrase = []
+        if current_duration >= max_duration or i == word_count:
+            boundaries.append(i)
+            phrase_start = i
             current_duration = 0
 
-    if current_phrase:
-        phrases.append(current_phrase)
+    return [words[start:end] for start, end in zip([0, *boundaries], boundaries)]
 
-    return phrases
+
+def _is_part_of_number(word: str) -> bool:
+    """
+    Check if a transcription word is a number or a number separator.
+    """
+    return word in _NUMBER_SEPARATORS or (word[:1].isdigit() and _NUMBER_PATTERN.fullmatch(word) is not None)
 
 
 def _extract_assets_from_scene(scene: Scene, assets: dict[str, Asset], asset_type: AssetType) -> list[Asset]:
@@ -751,6 +728,27 @@ def _extract_assets_from_scene(scene: Scene, assets: dict[str, Asset], asset_typ
     return [assets[ref.asset_id] for ref in scene.asset_references if ref.asset_type == asset_type]
 
 
+def _split_scene_references(
+    scene: Scene,
+) -> tuple[list[AssetReference], list[AssetReference], list[AssetReference]]:
+    """
+    Splits the asset references of a scene into subtitle, image and other references in a single pass.
+    """
+    subtitle_refs: list[AssetReference] = []
+    image_refs: list[AssetReference] = []
+    other_refs: list[AssetReference] = []
+
+    for ref in scene.asset_references:
+        if ref.asset_type == "subtitle":
+            subtitle_refs.append(ref)
+        elif ref.asset_type == "image":
+            image_refs.append(ref)
+        else:
+            other_refs.append(ref)
+
+    return subtitle_refs, image_refs, other_refs
+
+
 def _extract_assets_from_timeline(timeline: Timeline, assets: dict[str, Asset], asset_type: AssetType) -> list[Asset]:
     """
     Extracts asset references of a given type from a timeline.
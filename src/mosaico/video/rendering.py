@@ -1,17 +1,24 @@
 from __future__ import annotations
 
+import contextvars
+import functools
 import multiprocessing
+import subprocess
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from moviepy.audio.AudioClip import AudioClip, CompositeAudioClip
+from moviepy.Clip import Clip
+from moviepy.config import FFMPEG_BINARY
 from moviepy.video.compositing.CompositeVideoClip import CompositeVideoClip
 from moviepy.video.VideoClip import VideoClip
 
 from mosaico.assets.audio import AudioAsset
 from mosaico.assets.reference import AssetReference
 from mosaico.clip_makers.factory import make_clip
+from mosaico.clip_makers.image import decoded_image_cache
 
 
 if TYPE_CHECKING:
@@ -27,14 +34,38 @@ _CODEC_FILE_EXTENSION_MAP = {
     "png": ".avi",
     "libvorbis": ".ogv",
     "libvpx": ".webm",
+    "h264_nvenc": ".mp4",
+    "h264_videotoolbox": ".mp4",
+    "h264_qsv": ".mp4",
+    "h264_amf": ".mp4",
 }
 
+_FILE_EXTENSION_CODEC_MAP = {
+    ".mp4": "libx264",
+    ".avi": "rawvideo",
+    ".ogv": "libvorbis",
+    ".webm": "libvpx",
+}
+"""Preferred codec for each output file extension."""
+
+_HARDWARE_ENCODER_PARAMS: dict[str, list[str]] = {
+    "h264_nvenc": ["-rc", "vbr", "-cq", "23"],
+    "h264_videotoolbox": ["-q:v", "65"],
+    "h264_qsv": ["-global_quality", "23"],
+    "h264_amf": ["-rc", "cqp", "-qp_i", "23", "-qp_p", "23", "-qp_b", "23"],
+}
+"""H.264 hardware encoders, in order of preference, with the ffmpeg quality parameters used to encode with them."""
+
+_LIBX264_WRITER_KWARGS = frozenset({"preset", "bitrate", "ffmpeg_params"})
+"""Video writer arguments that are specific to the libx264 encoder settings chosen by the caller."""
+
 
 def render_video(
     project: VideoProject,
     output_path: str | Path,
     *,
     overwrite: bool = False,
+    hardware_encoding: bool = False,
     **kwargs: Any,
 ) -> Path:
     """
@@ -51,8 +82,15 @@ def render_video(
         - png: .avi
         - libvorbis: .ogv
         - libvpx: .webm
+        - h264_nvenc, h264_videotoolbox, h264_qsv, h264_amf: .mp4
+
+        Unless a preset is given, libx264 encodes with the "veryfast" preset, trading some file size for
+        encoding speed.
 
     :param overwrite: Whether to overwrite the output file if it already exists.
+    :param hardware_encoding: Whether to encode MP4 files with an H.264 hardware encoder, if ffmpeg can open one
+        on this machine. It is only used when no codec, preset, bitrate or ffmpeg parameters are given, as those
+        are libx264 settings. Falls back to libx264 otherwise.
     :param kwargs: Additional keyword arguments to pass to Moviepy clip video writer.
     :return: The path to the rendered video.
     """
@@ -73,25 +111,34 @@ def render_video(
         msg = f"Output file already exists: {output_path}"
         raise FileExistsError(msg)
 
-    video_clips = []
-    audio_clips = []
-
-    for event in project.timeline:
-        event_asset_ref_pairs = _get_event_assets_and_refs(event, project)
-        event_video_clips, event_audio_clips = _render_event_clips(event_asset_ref_pairs, project.config.resolution)
-        video_clips.extend(event_video_clips or [])
-        audio_clips.extend(event_audio_clips or [])
+    asset_ref_pairs = [pair for event in project.timeline for pair in _get_event_assets_and_refs(event, project)]
+    video_clips, audio_clips = _render_event_clips(asset_ref_pairs, project.config.resolution)
+    duration = project.duration
 
     video: VideoClip = (
         CompositeVideoClip(video_clips, size=project.config.resolution)
         .with_fps(project.config.fps)
-        .with_duration(project.duration)
+        .with_duration(duration)
     )
 
     if audio_clips:
-        audio = CompositeAudioClip(audio_clips).with_duration(project.duration)
+        audio = CompositeAudioClip(audio_clips).with_duration(duration)
         video = video.with_audio(audio)
 
+    if (
+        hardware_encoding
+        and not kwargs.get("codec")
+        and output_codec == "libx264"
+        and _LIBX264_WRITER_KWARGS.isdisjoint(kwargs)
+    ):
+        hardware_codec = _detect_hardware_encoder()
+        if hardware_codec is not None:
+            output_codec = hardware_codec
+            kwargs["ffmpeg_params"] = list(_HARDWARE_ENCODER_PARAMS[hardware_codec])
+
+    if output_codec == "libx264":
+        kwargs.setdefault("preset", "veryfast")
+
     kwargs["codec"] = output_codec
     kwargs["audio_codec"] = kwargs.get("audio_codec", "aac")
     kwargs["threads"] = kwargs.get("threads", multiprocessing.cpu_count())
@@ -107,10 +154,42 @@ def _guess_codec_from_file_path(file_path: Path) -> str | None:
     """
     Guess video codec from file path.
     """
-    for codec, file_ext in _CODEC_FILE_EXTENSION_MAP.items():
-        if file_path.name.endswith(file_ext):
+    return _FILE_EXTENSION_CODEC_MAP.get(file_path.suffix)
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hardware_encoder() -> str | None:
+    """
+    Detect an H.264 hardware encoder that ffmpeg can use on this machine.
+
+    Encoders listed by ffmpeg may still be unusable (e.g. NVENC without an NVIDIA GPU), so each candidate
+    is probed by encoding a single frame.
+    """
+    try:
+        encoders = subprocess.run(
+            [FFMPEG_BINARY, "-hide_banner", "-encoders"], capture_output=True, text=True, check=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    for codec, params in _HARDWARE_ENCODER_PARAMS.items():
+        if f" {codec} " in encoders and _can_encode_with(codec, params):
             return codec
 
+    return None
+
+
+def _can_encode_with(codec: str, params: list[str]) -> bool:
+    """
+    Check whether ffmpeg can encode a single frame with the given codec.
+    """
+    command = [FFMPEG_BINARY, "-hide_banner", "-loglevel", "error", "-f", "lavfi", "-i", "color=size=256x256"]
+    command += ["-frames:v", "1", "-c:v", codec, *params, "-f", "null", "-"]
+    try:
+        return subprocess.run(command, capture_output=True, timeout=10).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
 
 def _get_event_assets_and_refs(event: TimelineEvent, project: VideoProject) -> list[tuple[Asset, AssetReference]]:
     """
@@ -121,7 +200,8 @@ def _get_event_assets_and_refs(event: TimelineEvent, project: VideoProject) -> l
     for asset_ref in asset_refs:
         asset = project.get_asset(asset_ref.asset_id)
         if asset_ref.asset_params is not None:
-            asset = asset.with_params(asset_ref.asset_params)  # type: ignore
+            # Copy the asset, as it may be shared by references with different params
+            asset = asset.model_copy().with_params(asset_ref.asset_params)  # type: ignore
         event_asset_ref_pairs.append((asset, asset_ref))
     return event_asset_ref_pairs
 
@@ -140,21 +220,59 @@ def _render_event_clips(
 ) -> tuple[list[VideoClip], list[AudioClip]]:
     """
     Compose a video clip from the given assets.
+
+    Clips are made concurrently in a thread pool, keeping the order of the given assets: text drawing, blurring
+    and compositing, image reading, decoding and resizing, as well as audio decoding and exporting through
+    ffmpeg, are independent between assets and mostly run in native code, subprocesses or wait on I/O.
     """
     audio_clips = []
     video_clips = []
 
-    for asset, asset_ref in asset_and_ref_pairs:
-        clip = make_clip(asset, asset_ref.duration, video_resolution, asset_ref.effects)
-        clip = clip.with_start(asset_ref.start_time)
+    assets, asset_refs = zip(*asset_and_ref_pairs) if asset_and_ref_pairs else ((), ())
 
-        if hasattr(asset.params, "z_index"):
-            layer = getattr(asset.params, "z_index")
-            clip = clip.with_layer_index(layer)
+    with decoded_image_cache(), ThreadPoolExecutor(thread_name_prefix="mosaico-clip") as executor:
+        # Clips are made in copies of this context, so image clips share the images decoded for this render
+        context = contextvars.copy_context()
+        clips = executor.map(
+            lambda asset, asset_ref: context.copy().run(_make_asset_ref_clip, asset, asset_ref, video_resolution),
+            assets,
+            asset_refs,
+        )
 
-        if isinstance(asset, AudioAsset):
-            audio_clips.append(clip)
-        else:
-            video_clips.append(clip)
+        for asset, clip in zip(assets, clips):
+            if isinstance(asset, AudioAsset):
+                audio_clips.append(clip)
+            else:
+                video_clips.append(clip)
 
     return video_clips, audio_clips
+
+
+def _make_asset_ref_clip(asset: Asset, asset_ref: AssetReference, video_resolution: FrameSize) -> Clip:
+    """
+    Make the clip of an asset, placed according to its reference.
+    """
+    clip = make_clip(asset, asset_ref.duration, video_resolution, asset_ref.effects)
+
+    # The clip was just made for this reference, so it is placed in place instead of through
+    # MoviePy's copying `with_start` and `with_layer_index` methods
+    _set_clip_start(clip, asset_ref.start_time)
+
+    if hasattr(asset.params, "z_index"):
+        clip.layer_index = getattr(asset.params, "z_index")
+
+    return clip
+
+
+def _set_clip_start(clip: Clip, start_time: float) -> None:
+    """
+    Set the start time of a clip and of its mask and audio, if any, the way `Clip.with_start` does.
+    """
+    for target in (clip, getattr(clip, "mask", None), getattr(clip, "audio", None)):
+        if target is None:
+            continue
+        target.start = start_time
+        if target.duration is not None:
+            target.end = start_time + target.duration
+        elif target.end is not None:
+            target.duration = target.end - start_time
@@ -50,7 +50,7 @@ class Timeline(RootModel):
                 return self._add_asset_reference(event)
             return self._add_scene(event)
 
-        if isinstance(event, Sequence):
+        if isinstance(event, Sequence) and not isinstance(event, (str, bytes)):
             for item in event:
                 self.add_events(item)
             return self
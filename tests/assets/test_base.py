@@ -59,6 +59,13 @@ def test_asset_with_params(params):
     assert asset.params == TestParams.model_validate(params)
 
 
+def test_asset_with_params_model_keeps_unset_fields():
+    asset = TestAsset.from_data("test", params=TestParams(foo="world"))
+    updated_asset = asset.with_params(TestParams(bar=24))
+    assert updated_asset.params == TestParams(foo="world", bar=24)
+    assert updated_asset.params.model_fields_set == {"foo", "bar"}
+
+
 def test_asset_with_params_chaining():
     asset = TestAsset.from_data("test")
     updated_asset = asset.with_params({"foo": "world"}).with_params({"bar": 24})
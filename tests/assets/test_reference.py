@@ -0,0 +1,85 @@
+import pytest
+from pydantic import ValidationError
+
+from mosaico.assets.audio import AudioAssetParams
+from mosaico.assets.factory import create_asset
+from mosaico.assets.reference import AssetReference, _get_asset_params_class
+from mosaico.assets.text import TextAssetParams
+from mosaico.effects.fade import FadeInEffect
+from mosaico.effects.zoom import ZoomInEffect
+
+
+def test_with_times() -> None:
+    ref = AssetReference(asset_id="asset", asset_type="text").with_start_time(2).with_end_time(5)
+    assert ref.start_time == 2
+    assert ref.end_time == 5
+    assert ref.duration == 3
+
+
+@pytest.mark.parametrize("method", ["with_start_time", "with_end_time"])
+def test_with_negative_time(method) -> None:
+    ref = AssetReference(asset_id="asset", asset_type="text")
+    with pytest.raises(ValueError, match="must be non-negative"):
+        getattr(ref, method)(-1)
+
+
+def test_with_params() -> None:
+    params = TextAssetParams(font_size=10)
+    ref = AssetReference(asset_id="asset", asset_type="subtitle").with_params(params)
+    assert ref.asset_params is params
+
+
+def test_with_params_invalid_type() -> None:
+    ref = AssetReference(asset_id="asset", asset_type="text")
+    with pytest.raises(ValueError, match="Asset params must be of type TextAssetParams"):
+        ref.with_params(AudioAssetParams())
+    assert ref.asset_params is None
+
+
+def test_with_effects() -> None:
+    ref = AssetReference(asset_id="asset", asset_type="image")
+    assert ref.effects == ()
+
+    ref = ref.with_effects([FadeInEffect()]).with_effects([ZoomInEffect()])
+    assert ref.effects == (FadeInEffect(), ZoomInEffect())
+    assert AssetReference(asset_id="asset", asset_type="image").effects == ()
+
+
+@pytest.mark.parametrize("effects", [[FadeInEffect()], (FadeInEffect(),)])
+def test_from_asset_with_effects(effects) -> None:
+    asset = create_asset("text", data="text")
+    ref = AssetReference.from_asset(asset, effects=effects)
+    assert ref.effects == (FadeInEffect(),)
+
+
+def test_from_dict_with_params() -> None:
+    data = {"asset_id": "asset", "asset_type": "text", "asset_params": {"font_size": 10}, "end_time": 5}
+    ref = AssetReference.from_dict(data)
+    assert isinstance(ref.asset_params, TextAssetParams)
+    assert ref.asset_params.font_size == 10
+    assert ref.end_time == 5
+    assert "asset_params" in ref.model_fields_set
+    assert data["asset_params"] == {"font_size": 10}
+
+
+def test_from_dict_with_invalid_params() -> None:
+    data = {"asset_id": "asset", "asset_type": "audio", "asset_params": {"volume": "loud"}}
+    with pytest.raises(ValueError):
+        AssetReference.from_dict(data)
+
+
+def test_asset_params_class_lookup_is_cached() -> None:
+    AssetReference(asset_id="asset", asset_type="text", asset_params=TextAssetParams())
+    hits = _get_asset_params_class.cache_info().hits
+    AssetReference(asset_id="asset", asset_type="text", asset_params=TextAssetParams())
+    assert _get_asset_params_class.cache_info().hits == hits + 1
+
+
+def test_effects_are_validated_by_type() -> None:
+    ref = AssetReference.model_validate(
+        {"asset_id": "asset", "asset_type": "image", "effects": [{"type": "fade_in"}, {"type": "zoom_in"}]}
+    )
+    assert ref.effects == (FadeInEffect(), ZoomInEffect())
+
+    with pytest.raises(ValidationError, match="does not match any of the expected tags"):
+        AssetReference.model_validate({"asset_id": "asset", "asset_type": "image", "effects": [{"type": "spin"}]})
@@ -0,0 +1,18 @@
+from pydantic_extra_types.color import Color
+
+from mosaico.assets.text import TextAssetParams
+
+
+def test_params_share_default_colors_without_aliasing() -> None:
+    params = TextAssetParams()
+    other_params = TextAssetParams()
+    assert params.font_color is other_params.font_color
+
+    params.font_color = Color("#fff")
+    copied_params = other_params.model_copy(update={"stroke_color": Color("red")})
+
+    assert params.font_color.as_hex() == "#fff"
+    assert copied_params.stroke_color.as_hex() == "#f00"
+    assert (other_params.font_color.as_hex(), other_params.stroke_color.as_hex()) == ("#000", "#000")
+    assert (copied_params.font_color.as_hex(), params.stroke_color.as_hex()) == ("#000", "#000")
+    assert TextAssetParams().background_color.as_rgb_tuple() == (0, 0, 0, 0)
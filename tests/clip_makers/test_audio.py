@@ -0,0 +1,63 @@
+import io
+import wave
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+from moviepy.audio.AudioClip import AudioArrayClip
+from moviepy.audio.io.AudioFileClip import AudioFileClip
+from pydub import AudioSegment
+
+from mosaico.assets.audio import AudioAsset
+from mosaico.clip_makers.audio import AudioClipMaker
+
+
+SAMPLE_RATE = 8000
+
+
+@pytest.fixture
+def samples():
+    """Create 2 seconds of mono 16-bit samples."""
+    return (np.sin(2 * np.pi * 440 * np.arange(SAMPLE_RATE * 2) / SAMPLE_RATE) * 12000).astype(np.int16)
+
+
+@pytest.fixture
+def wav_asset(samples):
+    """Create a 2 seconds mono WAV audio asset."""
+    wav_buf = io.BytesIO()
+    with wave.open(wav_buf, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        wav.writeframes(samples.tobytes())
+    info = {"duration": 2.0, "sample_rate": SAMPLE_RATE, "sample_width": 2, "channels": 1}
+    return AudioAsset.from_data(wav_buf.getvalue(), info=info)
+
+
+def test_make_clip_without_edits_skips_decoding(wav_asset):
+    """Test that audio fitting the clip is handed to MoviePy without being decoded and exported."""
+    with patch("mosaico.clip_makers.audio.AudioSegment") as mock_audio_segment:
+        clip = AudioClipMaker(duration=3.0).make_clip(wav_asset)
+
+    mock_audio_segment.from_file.assert_not_called()
+    assert isinstance(clip, AudioFileClip)
+    assert clip.duration == 2.0
+    assert np.abs(clip.get_frame(np.arange(0, 1, 1 / SAMPLE_RATE))).max() > 0
+
+
+@pytest.mark.parametrize(
+    "duration, crop, expected_range",
+    [(1.5, None, (0, 1.5)), (None, (0.5, 1.0), (0.5, 1.0))],
+)
+def test_make_clip_with_edits_keeps_samples_in_memory(wav_asset, samples, duration, crop, expected_range):
+    """Test that trimmed or cropped audio is made into a clip from its samples."""
+    wav_asset.params.crop = crop
+    segment = AudioSegment(samples.tobytes(), sample_width=2, frame_rate=SAMPLE_RATE, channels=1)
+
+    with patch("mosaico.clip_makers.audio.AudioSegment.from_file", return_value=segment):
+        clip = AudioClipMaker(duration=duration).make_clip(wav_asset)
+
+    start, end = (round(t * SAMPLE_RATE) for t in expected_range)
+    assert isinstance(clip, AudioArrayClip)
+    assert clip.duration == expected_range[1] - expected_range[0]
+    np.testing.assert_allclose(clip.array[:, 0], samples[start:end] / 32768)
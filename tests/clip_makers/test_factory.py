@@ -21,6 +21,11 @@ def test_get_clip_maker_invalid_type() -> None:
         get_clip_maker_class("invalid_type")
 
 
+def test_get_clip_maker_is_cached() -> None:
+    assert get_clip_maker_class("image") is get_clip_maker_class("image")
+    assert get_clip_maker_class.cache_info().hits > 0
+
+
 @patch("mosaico.clip_makers.factory.get_clip_maker_class")
 def test_make_clip(mock_get_clip_maker_class) -> None:
     mock_asset = Mock(spec=Asset, type="image")
@@ -62,3 +67,11 @@ def test_make_clip_invalid_type():
 
     with pytest.raises(InvalidAssetTypeError):
         make_clip(asset, duration, video_resolution)
+
+
+def test_make_clip_invalid_effect():
+    asset = Mock(spec=Asset)
+    asset.type = "image"
+
+    with pytest.raises(ValueError, match="does not implement the 'apply' method"):
+        make_clip(asset, 10.0, (1920, 1080), effects=[object()])
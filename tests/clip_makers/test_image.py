@@ -7,7 +7,14 @@ from moviepy.video.VideoClip import ImageClip
 from PIL import Image
 
 from mosaico.assets.image import ImageAsset
-from mosaico.clip_makers.image import ImageClipMaker, _resize_and_crop
+from mosaico.clip_makers.image import (
+    ImageClipMaker,
+    _decode_image,
+    _decoded_images,
+    _get_decode_reduction,
+    _resize_and_crop,
+    decoded_image_cache,
+)
 from mosaico.positioning.absolute import AbsolutePosition
 from mosaico.positioning.relative import RelativePosition
 
@@ -94,6 +101,68 @@ def test_make_clip_opaque_png(clip_maker, opaque_png_data):
     assert clip.size == (200, 200)
 
 
+def test_make_clip_keeps_rgb_channel_order(clip_maker, transparent_png_data):
+    """Test that decoded image data is handed to MoviePy in RGB order, with alpha as mask."""
+    asset = ImageAsset.from_data(transparent_png_data)
+    asset.params.as_background = False
+
+    clip = clip_maker.make_clip(asset)
+
+    assert tuple(clip.get_frame(0)[100, 100]) == (255, 0, 0)
+    assert clip.mask.get_frame(0)[100, 100] == 1
+    assert clip.mask.get_frame(0)[0, 0] == 0
+
+
+def test_make_clip_reuses_decoded_image_within_cache(clip_maker, opaque_png_data):
+    """Test that clips of the same image asset share a single read-only decoded array within a cache context."""
+    asset = ImageAsset.from_data(opaque_png_data)
+
+    with decoded_image_cache():
+        first_clip = clip_maker.make_clip(asset)
+        second_clip = clip_maker.make_clip(asset)
+        other_clip = clip_maker.make_clip(ImageAsset.from_data(opaque_png_data))
+
+    assert first_clip.img is second_clip.img
+    assert other_clip.img is not first_clip.img
+    assert not first_clip.img.flags.writeable
+    assert _decoded_images.get() is None
+
+
+def test_make_clip_does_not_keep_decoded_image(clip_maker, opaque_png_data):
+    """Test that decoded images are not kept outside a cache context."""
+    asset = ImageAsset.from_data(opaque_png_data)
+
+    assert clip_maker.make_clip(asset).img is not clip_maker.make_clip(asset).img
+
+
+def test_decode_image_resizes_to_target_size(opaque_png_data):
+    """Test that images are decoded at their own size, unless a target size is given."""
+    assert _decode_image(opaque_png_data, None).shape == (200, 200, 3)
+    assert _decode_image(opaque_png_data, (100, 50)).shape == (50, 100, 3)
+
+
+@pytest.mark.parametrize(
+    "image_size, target_size, expected_reduction",
+    [((800, 600), (100, 50), 8), ((800, 600), (200, 150), 4), ((800, 600), (400, 200), 2), ((800, 600), (500, 300), 1)],
+)
+def test_get_decode_reduction(jpeg_data, image_size, target_size, expected_reduction):
+    """Test that JPEG images are scaled down while decoding as much as the target size allows."""
+    assert _get_decode_reduction(jpeg_data, image_size, target_size) == expected_reduction
+
+
+def test_get_decode_reduction_only_for_jpeg(opaque_png_data):
+    """Test that images other than JPEG are always fully decoded."""
+    assert _get_decode_reduction(opaque_png_data, (800, 600), (100, 50)) == 1
+
+
+def test_decode_image_with_reduction(jpeg_data):
+    """Test that reduced JPEG decoding still resizes to the target size, in RGB order."""
+    image = _decode_image(jpeg_data, (50, 25), 4)
+
+    assert image.shape == (25, 50, 3)
+    assert tuple(image[12, 25]) == pytest.approx((0, 0, 255), abs=2)
+
+
 def test_make_clip_with_relative_position(clip_maker, transparent_png_data):
     """Test creating clip with relative positioning."""
     asset = ImageAsset.from_data(transparent_png_data)
@@ -0,0 +1,24 @@
+import pytest
+
+from mosaico.assets.subtitle import SubtitleAsset
+from mosaico.clip_makers.subtitle import SubtitleClipMaker
+from mosaico.positioning.region import RegionPosition
+
+
+@pytest.mark.parametrize(
+    "y, expected_y",
+    [
+        ("top", lambda clip: 1080 * 0.2),
+        ("bottom", lambda clip: 1080 * 0.8 - clip.h // 2),
+        ("center", lambda _: "center"),
+    ],
+)
+def test_make_clip_positions_subtitle(y, expected_y):
+    """Test that subtitles are centered horizontally and placed at the top, bottom or center of the video."""
+    asset = SubtitleAsset.from_data("Subtitle text", params={"position": RegionPosition(x="center", y=y)})
+
+    clip = SubtitleClipMaker(duration=2.0, video_resolution=(1920, 1080)).make_clip(asset)
+
+    assert clip.pos(0) == ("center", expected_y(clip))
+    assert clip.mask.pos(0) == clip.pos(0)
+    assert clip.duration == 2.0
@@ -1,14 +1,18 @@
 import math
 
-from PIL import ImageFont
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
 
 from mosaico.assets.factory import create_asset
 from mosaico.assets.text import TextAssetParams
 from mosaico.clip_makers.factory import make_clip
 from mosaico.clip_makers.text import (
     SystemFont,
+    _alpha_composite,
+    _crop_to_content,
     _draw_text_shadow_image,
     _get_font_text_size,
+    _get_shadow_offset,
     _get_system_fallback_font_name,
     _list_system_fonts,
     _load_font,
@@ -63,6 +67,14 @@ def test_load_font():
     assert isinstance(font, ImageFont.FreeTypeFont)
 
 
+def test_load_font_is_cached():
+    """Test that fonts are loaded once per family and size."""
+    font_name = _get_system_fallback_font_name()
+
+    assert _load_font(font_name, 12) is _load_font(font_name, 12)
+    assert _load_font(font_name, 12) is not _load_font(font_name, 14)
+
+
 def test_get_system_fallback_font():
     """Test system fallback font retrieval."""
     fallback_font = _get_system_fallback_font_name()
@@ -80,6 +92,25 @@ def test_wrap_text():
     assert "\n" in wrapped
 
 
+def test_wrap_text_lines_fit_max_width():
+    """Test that wrapped lines fit the given width and keep every word."""
+    font = _load_font(_get_system_fallback_font_name(), 12)
+    text = "This is a very long text that should be wrapped properly\nSecond paragraph"
+
+    wrapped = _wrap_text(text, font, 100)
+
+    assert wrapped.split() == text.split()
+    assert all(font.getlength(line) <= 100 for line in wrapped.split("\n"))
+
+
+def test_wrap_text_returns_fitting_text_unchanged():
+    """Test that text fitting the given width is returned as is."""
+    font = _load_font(_get_system_fallback_font_name(), 12)
+    text = "Short  headline"
+
+    assert _wrap_text(text, font, 1000) is text
+
+
 def test_text_size_calculation():
     """Test text size calculation."""
     font = _load_font(_get_system_fallback_font_name(), 12)
@@ -92,6 +123,28 @@ def test_text_size_calculation():
     assert height > 0
 
 
+def test_text_size_fits_multiline_text():
+    """Test that the text size fits the drawn multiline text without over-allocating lines."""
+    fallback_font = _load_font(_get_system_fallback_font_name(), 40)
+    serif_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSerif.ttf", 72)
+    draw = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+
+    # The serif "f" draws past its advance width
+    cases = [
+        (fallback_font, "First line\nSecond line\nThird", 0, 0),
+        (fallback_font, "First line\nSecond line\nThird", 10, 2),
+        (serif_font, "Wolf", 0, 0),
+        (serif_font, "Big\nff", 10, 2),
+    ]
+    for font, text, line_height, stroke_width in cases:
+        width, height = _get_font_text_size(text, font, line_height, stroke_width)
+        _, _, right, bottom = draw.multiline_textbbox(
+            (0, 0), text, font=font, spacing=line_height, stroke_width=stroke_width
+        )
+        assert right <= width < right + 2 * stroke_width + 2
+        assert bottom <= height < bottom + font.size
+
+
 def test_font_matching():
     """Test font matching functionality."""
     font = SystemFont("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf")
@@ -101,50 +154,62 @@ def test_font_matching():
     assert not font.matches("Arial")
 
 
-def test_shadow_image_size_expansion():
-    """Test that shadow image size is expanded to accommodate shadow offset."""
+def test_shadow_offset():
+    """Test that the shadow offset follows the shadow angle and distance."""
+    # With 40 pixel distance at 0 degrees, the shadow only moves to the right
+    assert _get_shadow_offset(0, 40) == (40, 0)
+
+    # With 45 degree angle, both x and y offsets should be ~21 pixels
+    expected_offset = round(30 * math.cos(math.radians(45)))
+    assert _get_shadow_offset(45, 30) == (expected_offset, expected_offset)
+
+    # With 135 degree angle, the shadow moves to the left
+    assert _get_shadow_offset(135, 30) == (-expected_offset, expected_offset)
+
+
+def test_shadow_image_fits_canvas():
+    """Test that the shadow is drawn into a canvas of the requested size."""
     font = _load_font(_get_system_fallback_font_name(), 40)
-    text = "Test text"
-    text_size = (50, 30)
 
-    # Create shadow image with large offset
     shadow_image = _draw_text_shadow_image(
-        text=text,
-        text_size=text_size,
+        text="Test text",
         font=font,
         line_height=0,
         align="left",
         shadow_color="black",
-        shadow_angle=0,
-        shadow_distance=40,  # Large offset
         shadow_blur=2,
         shadow_opacity=0.8,
+        canvas_size=(250, 80),
+        position=(10, 10),
     )
 
-    # Shadow image should be expanded to accommodate the offset
-    # With 40 pixel offset at 0 degrees, width should be 50 + 40 = 90
-    assert shadow_image.size[0] == text_size[0] + 40  # 90
-    assert shadow_image.size[1] == text_size[1]  # 30
+    assert shadow_image.shape == (80, 250, 4)
+    assert shadow_image[..., 3].max() <= round(255 * 0.8)
+    assert shadow_image[0, 0, 3] == 0
 
-    # Test with different angle
-    shadow_image_diagonal = _draw_text_shadow_image(
-        text=text,
-        text_size=text_size,
-        font=font,
-        line_height=0,
-        align="left",
-        shadow_color="black",
-        shadow_angle=45,  # 45 degree angle
-        shadow_distance=30,
-        shadow_blur=0,
-        shadow_opacity=1.0,
-    )
 
-    # With 45 degree angle, both x and y offsets should be ~21 pixels
-    # So both width and height should be expanded
-    expected_offset = abs(round(30 * math.cos(math.radians(45))))
-    assert shadow_image_diagonal.size[0] == text_size[0] + expected_offset
-    assert shadow_image_diagonal.size[1] == text_size[1] + expected_offset
+def test_alpha_composite_over_larger_background():
+    """Test that the foreground is composited over the top-left corner of the background."""
+    background = np.zeros((4, 6, 4), dtype=np.uint8)
+    background[..., 3] = 255
+    foreground = np.zeros((2, 3, 4), dtype=np.uint8)
+    foreground[0, 0] = (255, 0, 0, 255)
+
+    result = _alpha_composite(background, foreground)
+
+    assert result.shape == background.shape
+    assert tuple(result[0, 0]) == (255, 0, 0, 255)
+    assert tuple(result[1, 1]) == (0, 0, 0, 255)
+    assert tuple(result[3, 5]) == (0, 0, 0, 255)
+
+
+def test_crop_to_content():
+    """Test that arrays are cropped to their non-transparent pixels."""
+    image = np.zeros((10, 10, 4), dtype=np.uint8)
+    image[2:5, 3:7, 3] = 255
+
+    assert _crop_to_content(image).shape == (3, 4, 4)
+    assert _crop_to_content(np.zeros((2, 2, 4), dtype=np.uint8)).shape == (2, 2, 4)
 
 
 def test_user_scenario_with_negative_shadow_offset():
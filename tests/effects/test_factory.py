@@ -44,3 +44,20 @@ def test_create_effect_with_params(effect_type, params):
     assert isinstance(effect, EFFECT_MAP[effect_type])
     for key, value in params.items():
         assert getattr(effect, key) == value
+
+
+@pytest.mark.parametrize("effect_type", list(EFFECT_MAP))
+def test_create_effect_without_validation(effect_type):
+    effect = create_effect(effect_type, validate=False)
+    assert effect == create_effect(effect_type)
+
+
+def test_create_effect_without_validation_skips_checks():
+    effect = create_effect("zoom_in", validate=False, start_zoom=1.5, end_zoom=1.2)
+    assert isinstance(effect, ZoomInEffect)
+    assert effect.start_zoom == 1.5
+
+
+def test_effect_map_is_read_only():
+    with pytest.raises(TypeError):
+        EFFECT_MAP["custom"] = ZoomInEffect  # type: ignore
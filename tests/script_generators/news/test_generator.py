@@ -1,9 +1,15 @@
+import re
 from unittest.mock import patch
 
 import pytest
 
 from mosaico.media import Media
 from mosaico.script_generators.news.generator import NewsVideoScriptGenerator, ParagraphMediaSuggestion, ShootingScript
+from mosaico.script_generators.news.prompts import (
+    MEDIA_SUGGESTING_PROMPT,
+    SHOOTING_SCRIPT_PROMPT,
+    SUMMARIZE_CONTEXT_PROMPT,
+)
 from mosaico.script_generators.script import Shot, ShotMediaReference
 
 
@@ -148,3 +154,18 @@ def test_generate_uses_random_effect(
     # Check that _random_effect was called the correct number of times
     # We expect it to be called once for each image media reference without effects
     assert mock_random_effect.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "prompt, static_section",
+    [
+        (SUMMARIZE_CONTEXT_PROMPT, "OUTPUT GUIDELINES:"),
+        (MEDIA_SUGGESTING_PROMPT, "EXAMPLE OUTPUT:"),
+        (SHOOTING_SCRIPT_PROMPT, "OUTPUT GUIDELINES:"),
+    ],
+)
+def test_prompts_keep_static_sections_before_placeholders(prompt, static_section):
+    """Test that prompt instructions and examples precede every formatted value."""
+    first_placeholder = min(prompt.index(f"{{{name}}}") for name in re.findall(r"(?<!\{)\{(\w+)\}(?!\})", prompt))
+
+    assert prompt.index(static_section) < first_placeholder
@@ -0,0 +1,71 @@
+from unittest.mock import MagicMock, patch
+
+from mosaico.assets.audio import AudioInfo
+from mosaico.speech_synthesizers.elevenlabs import ElevenLabsSpeechSynthesizer
+
+
+def _audio_info(duration: float) -> AudioInfo:
+    return AudioInfo(duration=duration, sample_rate=44100, sample_width=2, channels=1)
+
+
+def test_synthesize_reuses_session() -> None:
+    synthesizer = ElevenLabsSpeechSynthesizer(api_key="test", voice_id="voice")
+    session = MagicMock()
+    session.post.side_effect = [
+        MagicMock(content=b"first", headers={"request-id": "request-1"}),
+        MagicMock(content=b"second", headers={"request-id": "request-2"}),
+    ]
+
+    with (
+        patch("mosaico.speech_synthesizers.elevenlabs.requests.Session") as mock_session_cls,
+        patch(
+            "mosaico.speech_synthesizers.elevenlabs.get_mp3_speech_info", return_value=_audio_info(1.5)
+        ) as mock_get_info,
+    ):
+        mock_session_cls.return_value.__enter__.return_value = session
+        assets = synthesizer.synthesize(["First text.", "Second text."])
+
+    assert [asset.data for asset in assets] == [b"first", b"second"]
+    assert all(asset.duration == 1.5 for asset in assets)
+    assert [call.args for call in mock_get_info.call_args_list] == [
+        (b"first", "First text."),
+        (b"second", "Second text."),
+    ]
+    mock_session_cls.assert_called_once_with()
+    mock_session_cls.return_value.__exit__.assert_called_once()
+    first_call, second_call = session.post.call_args_list
+    assert first_call.kwargs["headers"] == {"xi-api-key": "test"}
+    assert first_call.kwargs["json"]["next_text"] == "Second text."
+    assert second_call.kwargs["json"]["previous_request_ids"] == ["request-1"]
+
+
+def test_synthesize_concurrently_without_request_stitching() -> None:
+    synthesizer = ElevenLabsSpeechSynthesizer(api_key="test", voice_id="voice", max_concurrency=4)
+    sessions = []
+
+    def make_session() -> MagicMock:
+        session = MagicMock()
+        session.post.side_effect = lambda url, json, **kwargs: MagicMock(
+            content=json["text"].encode(), headers={"request-id": json["text"]}
+        )
+        sessions.append(session)
+        return session
+
+    texts = ["One.", "Two.", "Three."]
+
+    with (
+        patch("mosaico.speech_synthesizers.elevenlabs.requests.Session", side_effect=make_session),
+        patch("mosaico.speech_synthesizers.elevenlabs.get_mp3_speech_info", return_value=_audio_info(1.0)),
+    ):
+        assets = synthesizer.synthesize(texts)
+
+    assert [asset.data for asset in assets] == [b"One.", b"Two.", b"Three."]
+    assert 1 <= len(sessions) <= len(texts)
+    assert all(session.close.call_count == 1 for session in sessions)
+    requests_json = [call.kwargs["json"] for session in sessions for call in session.post.call_args_list]
+    assert all(request_json["previous_request_ids"] == [] for request_json in requests_json)
+    assert {(r["text"], r["previous_text"], r["next_text"]) for r in requests_json} == {
+        ("One.", None, "Two. Three."),
+        ("Two.", "One.", "Three."),
+        ("Three.", "One. Two.", None),
+    }
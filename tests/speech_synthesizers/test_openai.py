@@ -1,6 +1,12 @@
+import subprocess
+import time
+from unittest.mock import MagicMock, patch
+
 import pytest
+from moviepy.config import FFMPEG_BINARY
 from pydantic import ValidationError
 
+from mosaico.assets.audio import AudioInfo
 from mosaico.speech_synthesizers.openai import OpenAISpeechSynthesizer
 
 
@@ -18,3 +24,41 @@ def test_pass_instructions_as_synthesize_kwargs_raises_on_non_4o_model() -> None
         ValueError, match="`instructions` cannot be set when model is not from the GPT-4o family or higher."
     ):
         synthesizer.synthesize(["Test"], instructions="Test")
+
+
+def test_synthesize_keeps_texts_order() -> None:
+    synthesizer = OpenAISpeechSynthesizer(api_key="test", max_concurrency=3)
+    synthesizer._client = MagicMock()
+
+    def create_speech(**kwargs):
+        text = kwargs["input"]
+        # Later texts finish first
+        time.sleep(0.01 * (5 - int(text)))
+        return MagicMock(content=text.encode())
+
+    synthesizer._client.audio.speech.create.side_effect = create_speech
+    info = AudioInfo(duration=1.0, sample_rate=24000, sample_width=2, channels=1)
+
+    with patch("mosaico.speech_synthesizers.openai.get_mp3_speech_info", return_value=info):
+        assets = synthesizer.synthesize(["1", "2", "3", "4"], voice="echo")
+
+    assert [asset.data for asset in assets] == [b"1", b"2", b"3", b"4"]
+    assert all(asset.duration == 1.0 for asset in assets)
+    voices = {call.kwargs["voice"] for call in synthesizer._client.audio.speech.create.call_args_list}
+    assert voices == {"echo"}
+
+
+def test_synthesize_reads_audio_info_from_mp3(tmp_path) -> None:
+    mp3_path = tmp_path / "speech.mp3"
+    subprocess.run(
+        [FFMPEG_BINARY, "-loglevel", "error", "-f", "lavfi", "-i", "sine=duration=2", "-ar", "24000", mp3_path],
+        check=True,
+    )
+    synthesizer = OpenAISpeechSynthesizer(api_key="test")
+    synthesizer._client = MagicMock()
+    synthesizer._client.audio.speech.create.return_value = MagicMock(content=mp3_path.read_bytes())
+
+    [asset] = synthesizer.synthesize(["Test"])
+
+    assert asset.duration == pytest.approx(2, abs=0.1)
+    assert (asset.sample_rate, asset.sample_width, asset.channels) == (24000, 2, 1)
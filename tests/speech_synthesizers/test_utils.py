@@ -0,0 +1,8 @@
+import pytest
+
+from mosaico.speech_synthesizers.utils import get_mp3_speech_info
+
+
+def test_get_mp3_speech_info_raises_on_unreadable_audio() -> None:
+    with pytest.raises(ValueError, match="synthesized from text: 'Hello there.'"):
+        get_mp3_speech_info(b"not an mp3", "Hello there.")
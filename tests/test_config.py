@@ -60,6 +60,7 @@ def test_resolved_temp_dir_uses_system_temp_by_default(system_temp_dir):
     """Test that resolved_temp_dir uses system temp when no custom temp_dir is set."""
     settings = Settings()
     assert settings.resolved_temp_dir == system_temp_dir
+    assert os.access(settings.resolved_temp_dir, os.W_OK)
 
 
 def test_fallback_hierarchy_integration(tmp_path, monkeypatch, system_temp_dir):
@@ -108,27 +109,3 @@ def test_temp_dir_environment_variable(tmp_path, monkeypatch):
     settings = Settings()
     assert settings.temp_dir == str(custom_temp)
     assert settings.resolved_temp_dir == str(custom_temp)
-
-
-def test_cross_platform_temp_directory_resolution():
-    """Test that temp directory resolution works across different platforms."""
-    settings = Settings()
-    resolved_temp = settings.resolved_temp_dir
-
-    # Should resolve to a valid directory path
-    assert resolved_temp is not None
-    assert isinstance(resolved_temp, str)
-    assert len(resolved_temp) > 0
-
-    # The resolved path should be writable
-    temp_path = Path(resolved_temp)
-    assert temp_path.exists()
-    assert os.access(temp_path, os.W_OK)
-
-    # Should be one of the expected fallback locations (resolve paths for Windows compatibility)
-    expected_dirs = [
-        str(Path(tempfile.gettempdir()).resolve()),  # System temp
-        str(Path(os.getcwd()).resolve()),  # Current directory
-        str(Path.home().resolve()),  # User home
-    ]
-    assert resolved_temp in expected_dirs
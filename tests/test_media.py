@@ -1,10 +1,12 @@
 import base64
+import mimetypes
 
+import fsspec
 import pytest
 from pydantic import ValidationError
 
 from mosaico.integrations.base.adapters import Adapter
-from mosaico.media import Media
+from mosaico.media import Media, _guess_mime_type
 
 
 def create_temp_file(tmp_path, content, filename):
@@ -129,6 +131,13 @@ def test_from_path(tmp_path):
     assert media.mime_type == "text/plain"
 
 
+@pytest.mark.parametrize(
+    "path", ["image.jpg", "dir/IMAGE.PNG", "audio.tar.gz", "no_extension", "https://example.com/audio.mp3"]
+)
+def test_guess_mime_type_matches_mimetypes(path):
+    assert _guess_mime_type(path) == mimetypes.guess_type(path)[0]
+
+
 def test_from_path_with_encoding(tmp_path):
     file_path = create_temp_file(tmp_path, "test", "test.txt")
     media = Media.from_path(file_path, encoding="ascii")
@@ -221,6 +230,24 @@ def test_to_bytes_with_file_path(tmp_path):
     assert media.to_bytes() == b"test content"
 
 
+def test_to_bytes_with_home_relative_file_path(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    create_temp_file(tmp_path, "test content", "test.txt")
+    media = Media(path="~/test.txt")
+    assert media.to_bytes() == b"test content"
+    with media.to_bytes_io() as byte_stream:
+        assert byte_stream.read() == b"test content"
+
+
+def test_to_bytes_with_fsspec_url():
+    with fsspec.open("memory://test.txt", "wb") as f:
+        f.write(b"test content")
+    media = Media(path="memory://test.txt")
+    assert media.to_bytes() == b"test content"
+    with media.to_bytes_io() as byte_stream:
+        assert byte_stream.read() == b"test content"
+
+
 def test_to_bytes_with_non_utf8_encoding(tmp_path):
     file_path = create_temp_file(tmp_path, "test content", "test.txt")
     media = Media(path=file_path, encoding="ascii")
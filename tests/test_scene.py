@@ -27,3 +27,13 @@ def test_duration() -> None:
     ]
     scene = Scene(asset_references=asset_references)
     assert scene.duration == 20
+
+
+def test_remove_asset_id_references() -> None:
+    asset_references = [
+        AssetReference(asset_id="asset1", asset_type="text", start_time=0, end_time=10),
+        AssetReference(asset_id="asset2", asset_type="text", start_time=10, end_time=20),
+        AssetReference(asset_id="asset1", asset_type="text", start_time=20, end_time=30),
+    ]
+    scene = Scene(asset_references=asset_references).remove_asset_id_references("asset1")
+    assert [ref.asset_id for ref in scene.asset_references] == ["asset2"]
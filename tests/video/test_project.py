@@ -3,21 +3,23 @@ from __future__ import annotations
 import io
 from collections.abc import Sequence
 from typing import Any, ClassVar
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 import yaml
+from pydantic import ValidationError
 
 from mosaico.assets.audio import AudioAsset, AudioAssetParams, AudioInfo
 from mosaico.assets.reference import AssetReference
 from mosaico.assets.subtitle import SubtitleAsset
 from mosaico.assets.text import TextAsset, TextAssetParams
+from mosaico.assets.utils import convert_media_to_asset
 from mosaico.audio_transcribers.protocol import AudioTranscriber
 from mosaico.audio_transcribers.transcription import Transcription, TranscriptionWord
 from mosaico.exceptions import AssetNotFoundError, TimelineEventNotFoundError
 from mosaico.media import Media
 from mosaico.scene import Scene
-from mosaico.script_generators.script import ShootingScript, Shot
+from mosaico.script_generators.script import ShootingScript, Shot, ShotMediaReference
 from mosaico.video.project import VideoProject, VideoProjectConfig, _group_transcript_into_sentences
 from mosaico.video.timeline import Timeline
 
@@ -30,42 +32,27 @@ def test_default_config() -> None:
     assert config.fps == 30
 
 
-def test_add_single_asset() -> None:
-    asset = TextAsset.from_data("test", id="asset_1")
-    project = VideoProject().add_assets(asset)
-    assert "asset_1" in project.assets
-    assert project.assets["asset_1"].id == asset.id
-    assert project.assets["asset_1"].data == "test"
-
-
-def test_add_single_dict_asset() -> None:
-    asset = {"id": "asset_1", "type": "text", "data": "test"}
-    project = VideoProject().add_assets(asset)
-    assert "asset_1" in project.assets
-    assert project.assets["asset_1"].id == asset["id"]
-    assert project.assets["asset_1"].data == "test"
-
-
-def test_add_multiple_assets() -> None:
-    assets = [TextAsset.from_data("test", id="asset_1"), TextAsset.from_data("test", id="asset_2")]
-    project = VideoProject().add_assets(assets)
-    assert "asset_1" in project.assets
-    assert project.assets["asset_1"].id == assets[0].id
-    assert project.assets["asset_1"].data == "test"
-    assert "asset_2" in project.assets
-    assert project.assets["asset_2"].id == assets[1].id
-    assert project.assets["asset_2"].data == "test"
-
-
-def test_add_multiple_dict_assets() -> None:
-    assets = [{"id": "asset_1", "type": "text", "data": "test"}, {"id": "asset_2", "type": "text", "data": "test"}]
+@pytest.mark.parametrize(
+    "assets, expected_ids",
+    [
+        (TextAsset.from_data("test", id="asset_1"), ["asset_1"]),
+        ({"id": "asset_1", "type": "text", "data": "test"}, ["asset_1"]),
+        (
+            [TextAsset.from_data("test", id="asset_1"), TextAsset.from_data("test", id="asset_2")],
+            ["asset_1", "asset_2"],
+        ),
+        (
+            [{"id": "asset_1", "type": "text", "data": "test"}, {"id": "asset_2", "type": "text", "data": "test"}],
+            ["asset_1", "asset_2"],
+        ),
+    ],
+    ids=["asset", "dict", "assets", "dicts"],
+)
+def test_add_assets(assets, expected_ids) -> None:
     project = VideoProject().add_assets(assets)
-    assert "asset_1" in project.assets
-    assert project.assets["asset_1"].id == assets[0]["id"]
-    assert project.assets["asset_1"].data == "test"
-    assert "asset_2" in project.assets
-    assert project.assets["asset_2"].id == assets[1]["id"]
-    assert project.assets["asset_2"].data == "test"
+    assert list(project.assets) == expected_ids
+    assert all(project.assets[asset_id].id == asset_id for asset_id in expected_ids)
+    assert all(asset.data == "test" for asset in project.assets.values())
 
 
 def test_add_timeline_events_single_asset_reference():
@@ -146,6 +133,20 @@ def test_add_timeline_events_without_assets() -> None:
         VideoProject().add_timeline_events(event)
 
 
+def test_add_timeline_events_with_missing_asset_keeps_timeline() -> None:
+    asset = TextAsset.from_data("test", id="asset1")
+    project = VideoProject().add_assets(asset)
+    events = [
+        {"asset_id": "asset1", "asset_type": "text", "start_time": 0, "end_time": 10},
+        {"asset_references": [{"asset_id": "missing", "asset_type": "text", "start_time": 0, "end_time": 10}]},
+    ]
+
+    with pytest.raises(AssetNotFoundError, match="Asset with ID 'missing' not found in the project assets"):
+        project.add_timeline_events(events)
+
+    assert len(project.timeline) == 0
+
+
 def test_get_inexistent_timeline_event_error() -> None:
     with pytest.raises(TimelineEventNotFoundError):
         VideoProject().get_timeline_event(10)
@@ -156,6 +157,48 @@ def test_remove_inexistent_timeline_event_error() -> None:
         VideoProject().remove_timeline_event(10)
 
 
+def test_get_and_remove_timeline_event_with_negative_index() -> None:
+    assets = [TextAsset.from_data("test 1", id="test_1"), TextAsset.from_data("test 2", id="test_2")]
+    events = [
+        AssetReference(asset_id="test_1", asset_type="text", start_time=0, end_time=10),
+        AssetReference(asset_id="test_2", asset_type="text", start_time=10, end_time=20),
+    ]
+    project = VideoProject().add_assets(assets).add_timeline_events(events)
+
+    assert project.get_timeline_event(-2) == events[0]
+
+    with pytest.raises(TimelineEventNotFoundError):
+        project.get_timeline_event(-3)
+
+    project.remove_timeline_event(-2)
+    assert list(project.timeline) == [events[1]]
+
+
+def test_remove_asset_removes_every_reference() -> None:
+    assets = [TextAsset.from_data("test 1", id="test_1"), TextAsset.from_data("test 2", id="test_2")]
+    kept_ref = AssetReference(asset_id="test_2", asset_type="text", start_time=0, end_time=10)
+    events = [
+        AssetReference(asset_id="test_1", asset_type="text", start_time=0, end_time=10),
+        AssetReference(asset_id="test_1", asset_type="text", start_time=10, end_time=20),
+        Scene(
+            asset_references=[
+                AssetReference(asset_id="test_1", asset_type="text", start_time=20, end_time=30),
+                kept_ref,
+            ]
+        ),
+    ]
+    project = VideoProject().add_assets(assets).add_timeline_events(events)
+
+    project.remove_asset("test_1")
+
+    assert list(project.assets) == ["test_2"]
+    assert len(project.timeline) == 1
+    assert project.timeline[0].asset_references == [kept_ref]
+
+    with pytest.raises(AssetNotFoundError):
+        project.remove_asset("test_1")
+
+
 def test_duration() -> None:
     timeline_event_1 = AssetReference(asset_id="test_1", asset_type="text", start_time=0, end_time=10)
     timeline_event_2 = AssetReference(asset_id="test_2", asset_type="text", start_time=0, end_time=20)
@@ -186,15 +229,20 @@ def test_iter_timeline() -> None:
     assert project.timeline == Timeline().add_events([scene1, scene2])
 
 
-@pytest.fixture
-def mock_project_file(tmp_path):
+@pytest.fixture(scope="module")
+def project_yaml():
     project_data = {
         "config": {"title": "Test Project", "version": 1, "resolution": (1920, 1080), "fps": 30},
         "assets": {"asset1": {"type": "text", "data": "test", "id": "asset1"}},
         "timeline": [{"asset_id": "asset1", "asset_type": "text", "start_time": 0, "end_time": 10}],
     }
-    project_file = tmp_path / "project.yaml"
-    project_file.write_text(yaml.safe_dump(project_data))
+    return yaml.safe_dump(project_data)
+
+
+@pytest.fixture(scope="module")
+def mock_project_file(tmp_path_factory, project_yaml):
+    project_file = tmp_path_factory.mktemp("project") / "project.yaml"
+    project_file.write_text(project_yaml)
     return project_file
 
 
@@ -209,8 +257,8 @@ def test_from_file_success(mock_project_file):
     )
 
 
-def test_from_file_string_buffer(mock_project_file):
-    project_buf = io.StringIO(mock_project_file.read_text())
+def test_from_file_string_buffer(project_yaml):
+    project_buf = io.StringIO(project_yaml)
     project = VideoProject.from_file(project_buf)
     assert project.config.title == "Test Project"
     assert project.config.resolution == (1920, 1080)
@@ -228,9 +276,9 @@ def test_from_file_invalid_path():
 
 def test_to_file(mock_project_file, tmp_path):
     project = VideoProject.from_file(mock_project_file)
-    project_file = tmp_path / "project.yaml"
+    project_file = tmp_path / "output.yaml"
     project.to_file(project_file)
-    assert project_file.read_text() == mock_project_file.read_text()
+    assert VideoProject.from_file(project_file) == project
 
 
 def test_to_file_string_buffer(mock_project_file) -> None:
@@ -328,46 +376,47 @@ def sample_transcription():
     )
 
 
-def test_add_captions_basic(sample_transcription):
-    project = VideoProject().add_captions(sample_transcription)
-
-    # Verify assets were created
+@pytest.mark.parametrize(
+    "kwargs, expected_spans, expected_params",
+    [
+        ({}, [(0.0, 2.5)], {"font_size": 45, "font_color": "#fff"}),
+        ({"max_duration": 1}, [(0.0, 1.0), (1.0, 2.0), (2.0, 2.5)], {"font_size": 45, "font_color": "#fff"}),
+        (
+            {"params": TextAssetParams(font_size=24, font_color="#FFFFFF")},
+            [(0.0, 2.5)],
+            {"font_size": 24, "font_color": "#fff"},
+        ),
+    ],
+    ids=["basic", "max_duration", "params"],
+)
+def test_add_captions(sample_transcription, kwargs, expected_spans, expected_params):
+    project = VideoProject().add_captions(sample_transcription, **kwargs)
+
+    # Verify assets were created, one per phrase
     subtitle_assets = [asset for asset in project.assets.values() if isinstance(asset, SubtitleAsset)]
-    assert len(subtitle_assets) == 1
-
-    # Verify timeline events
-    subtitle_refs = [ref for ref in project.timeline if isinstance(project.assets[ref.asset_id], SubtitleAsset)]
-    assert len(subtitle_refs) == 1
-    assert subtitle_refs[0].start_time == 0.0
-    assert subtitle_refs[0].end_time == 2.5
-
-
-def test_add_captions_with_max_duration(sample_transcription):
-    project = VideoProject().add_captions(sample_transcription, max_duration=1)
+    assert len(subtitle_assets) == len(expected_spans)
 
-    # Should split into multiple subtitle assets/references
+    # Verify timing of segments and params of timeline events
     subtitle_refs = [ref for ref in project.timeline if isinstance(project.assets[ref.asset_id], SubtitleAsset)]
-    assert len(subtitle_refs) == 3
+    assert [(ref.start_time, ref.end_time) for ref in subtitle_refs] == expected_spans
+    assert all(ref.asset_params.model_dump(include=set(expected_params)) == expected_params for ref in subtitle_refs)
 
-    # Verify timing of segments
-    assert subtitle_refs[0].start_time == 0.0
-    assert subtitle_refs[0].end_time == 1.0
-    assert subtitle_refs[1].start_time == 1.0
-    assert subtitle_refs[1].end_time == 2.0
-    assert subtitle_refs[2].start_time == 2.0
-    assert subtitle_refs[2].end_time == 2.5
 
+def test_add_captions_overwrites_scene_subtitles(sample_transcription):
+    subtitles = [SubtitleAsset.from_data("first", id="sub1"), SubtitleAsset.from_data("second", id="sub2")]
+    scene = Scene(
+        asset_references=[
+            AssetReference.from_asset(subtitles[0], start_time=0, end_time=1),
+            AssetReference.from_asset(subtitles[1], start_time=1, end_time=2.5),
+        ]
+    )
+    project = VideoProject().add_assets(subtitles).add_timeline_events(scene)
 
-def test_add_captions_with_params(sample_transcription):
-    params = TextAssetParams(font_size=24, font_color="#FFFFFF")
-    project = VideoProject().add_captions(sample_transcription, params=params)
-
-    subtitle_refs = [ref for ref in project.timeline if ref.asset_type == "subtitle"]
-    assert len(subtitle_refs) == 1
+    project = project.add_captions(sample_transcription, scene_index=0, overwrite=True)
 
-    # Verify params were applied
-    assert subtitle_refs[0].asset_params.font_size == 24
-    assert subtitle_refs[0].asset_params.font_color.as_hex().upper() == "#FFF"
+    assert "sub1" not in project.assets
+    assert "sub2" not in project.assets
+    assert all(ref.asset_id in project.assets for ref in project.timeline[0].asset_references)
 
 
 def test_add_captions_from_transcriber(sample_transcription):
@@ -410,6 +459,32 @@ def test_from_script_generator():
     assert len(project.timeline) == 2
 
 
+def test_from_script_generator_converts_shared_media_once():
+    media = Media.from_data("image", id="1", mime_type="image/png")
+    script_generator = Mock()
+    script_generator.generate.return_value = ShootingScript(
+        title="Test Script",
+        shots=[
+            Shot(
+                number=number,
+                description=f"Shot {number}",
+                subtitle=f"Subtitle {number}",
+                media_references=[
+                    ShotMediaReference(media_id="1", type="image", start_time=number * 5, end_time=number * 5 + 5)
+                ],
+            )
+            for number in (1, 2)
+        ],
+    )
+
+    with patch("mosaico.video.project.convert_media_to_asset", wraps=convert_media_to_asset) as mock_convert:
+        project = VideoProject.from_script_generator(script_generator=script_generator, media=[media])
+
+    mock_convert.assert_called_once_with(media)
+    image_refs = [ref for scene in project.timeline for ref in scene.asset_references if ref.asset_type == "image"]
+    assert [ref.asset_id for ref in image_refs] == ["1", "1"]
+
+
 def test_group_words_into_phrases():
     transcription = Transcription(
         words=[
@@ -453,6 +528,20 @@ def test_group_words_into_phrases_with_numbers():
     assert " ".join(word.text for word in phrases[1]) == "and 6,789"
 
 
+def test_group_words_into_phrases_with_words_starting_with_digits():
+    transcription = Transcription(
+        words=[
+            TranscriptionWord(text="Room", start_time=0.0, end_time=0.4),
+            TranscriptionWord(text="12B", start_time=0.4, end_time=0.8),
+            TranscriptionWord(text=".", start_time=0.8, end_time=1.2),
+        ]
+    )
+
+    phrases = _group_transcript_into_sentences(transcription, max_duration=1.0)
+
+    assert [" ".join(word.text for word in phrase) for phrase in phrases] == ["Room 12B", "."]
+
+
 @pytest.mark.parametrize("config", [VideoProjectConfig(title="Test"), {"title": "Test"}], ids=["object", "dict"])
 def test_with_config(config) -> None:
     project = VideoProject().with_config(config)
@@ -460,6 +549,25 @@ def test_with_config(config) -> None:
     assert project.config.title == "Test"
 
 
+def test_with_config_setters() -> None:
+    project = VideoProject().with_title("Test").with_version(2).with_fps(24).with_resolution((1280, 720))
+
+    assert project.config == VideoProjectConfig(title="Test", version=2, fps=24, resolution=(1280, 720))
+
+
+def test_with_resolution_coerces_to_tuple() -> None:
+    assert VideoProject().with_resolution([1280, 720]).config.resolution == (1280, 720)
+
+
+@pytest.mark.parametrize(
+    "setter, value",
+    [("with_fps", 0), ("with_fps", -1), ("with_version", "x"), ("with_resolution", (1280,))],
+)
+def test_with_invalid_config_value(setter, value) -> None:
+    with pytest.raises(ValidationError):
+        getattr(VideoProject(), setter)(value)
+
+
 def test_with_subtitle_params_asset_reference() -> None:
     # Create a subtitle asset
     subtitle_asset = SubtitleAsset.from_data("test text", id="subtitle1")
@@ -622,32 +730,15 @@ def test_add_subtitles_from_transcription_with_max_duration() -> None:
     assert len(project.assets) == 3
     assert len(project.timeline) == 3
 
-    def _get_asset_id(index: int) -> str:
-        return list(project.assets.keys())[index]
-
-    subtitle_asset_1 = project.assets[_get_asset_id(0)]
-    assert isinstance(subtitle_asset_1, SubtitleAsset)
-    assert subtitle_asset_1.data == "Hello world"
-
-    subtitle_ref_1 = project.timeline[0]
-    assert subtitle_ref_1.start_time == 0.0
-    assert subtitle_ref_1.end_time == 1.0
-
-    subtitle_asset_2 = project.assets[_get_asset_id(1)]
-    assert isinstance(subtitle_asset_2, SubtitleAsset)
-    assert subtitle_asset_2.data == "This is a"
-
-    subtitle_ref_2 = project.timeline[1]
-    assert subtitle_ref_2.start_time == 1.0
-    assert subtitle_ref_2.end_time == 1.8
-
-    subtitle_asset_3 = project.assets[_get_asset_id(2)]
-    assert isinstance(subtitle_asset_3, SubtitleAsset)
-    assert subtitle_asset_3.data == "test"
-
-    subtitle_ref_3 = project.timeline[2]
-    assert subtitle_ref_3.start_time == 1.8
-    assert subtitle_ref_3.end_time == 2.3
+    expected_subtitles = [("Hello world", 0.0, 1.0), ("This is a", 1.0, 1.8), ("test", 1.8, 2.3)]
+    for subtitle_asset, subtitle_ref, (data, start_time, end_time) in zip(
+        project.assets.values(), project.timeline, expected_subtitles
+    ):
+        assert isinstance(subtitle_asset, SubtitleAsset)
+        assert subtitle_asset.data == data
+        assert subtitle_ref.asset_id == subtitle_asset.id
+        assert subtitle_ref.start_time == start_time
+        assert subtitle_ref.end_time == end_time
 
 
 def test_add_narration_resizes_scene_assets():
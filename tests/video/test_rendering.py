@@ -1,8 +1,21 @@
+import io
+import subprocess
 from pathlib import Path
 
 import pytest
+from PIL import Image
 
-from mosaico.video.rendering import _guess_codec_from_file_path, render_video
+from mosaico.assets.factory import create_asset
+from mosaico.assets.reference import AssetReference
+from mosaico.clip_makers.image import _decoded_images
+from mosaico.video import rendering
+from mosaico.video.rendering import (
+    _detect_hardware_encoder,
+    _guess_codec_from_file_path,
+    _make_asset_ref_clip,
+    _render_event_clips,
+    render_video,
+)
 
 
 # Dummy classes to simulate a VideoProject and minimal dependencies.
@@ -39,8 +52,8 @@ class DummyCompositeVideoClip:
         return self
 
     def write_videofile(self, path, **kwargs):
-        # Fake write; do nothing.
-        pass
+        # Fake write; only keep the writer arguments.
+        self.write_kwargs = kwargs
 
     def close(self):
         pass
@@ -78,15 +91,22 @@ def test_mismatching_codec_and_extension(tmp_path, dummy_project):
     output_file = tmp_path / "output.mp4"
     tmp_path.mkdir(exist_ok=True)
 
-    with pytest.raises(ValueError, match="Output file must be an '.avi' file."):
+    with pytest.raises(ValueError, match=r"Output file must be an '\.avi' file\."):
         render_video(dummy_project, output_file.as_posix(), codec="rawvideo")
 
 
-def test_guessing_codec_from_file_extension(tmp_path):
-    output_file = tmp_path / "output.avi"
-    output_codec = _guess_codec_from_file_path(output_file)
-
-    assert output_codec == "rawvideo"  # there are 3 alternatives, it should get the first one.
+@pytest.mark.parametrize(
+    "file_name, expected_codec",
+    [
+        ("output.mp4", "libx264"),
+        ("output.avi", "rawvideo"),  # there are 3 alternatives, it should get the first one.
+        ("output.webm", "libvpx"),
+        ("output.ogv", "libvorbis"),
+        ("output.mov", None),
+    ],
+)
+def test_guessing_codec_from_file_suffix(file_name, expected_codec):
+    assert _guess_codec_from_file_path(Path(file_name)) == expected_codec
 
 
 def test_successful_rendering(tmp_path, dummy_project):
@@ -95,3 +115,122 @@ def test_successful_rendering(tmp_path, dummy_project):
 
     assert Path(returned_path) == output_file.resolve()
     assert not output_file.exists()
+
+
+@pytest.fixture
+def written_videos(monkeypatch):
+    videos = []
+
+    def composite_video_clip(clips, size):
+        videos.append(DummyCompositeVideoClip(clips, size))
+        return videos[-1]
+
+    monkeypatch.setattr("mosaico.video.rendering.CompositeVideoClip", composite_video_clip)
+    return videos
+
+
+@pytest.mark.parametrize(
+    "codec, expected_params",
+    [
+        ("h264_nvenc", ["-rc", "vbr", "-cq", "23"]),
+        ("h264_videotoolbox", ["-q:v", "65"]),
+        ("h264_qsv", ["-global_quality", "23"]),
+        ("h264_amf", ["-rc", "cqp", "-qp_i", "23", "-qp_p", "23", "-qp_b", "23"]),
+    ],
+)
+def test_rendering_uses_detected_hardware_encoder(
+    tmp_path, dummy_project, written_videos, monkeypatch, codec, expected_params
+):
+    monkeypatch.setattr(rendering, "_detect_hardware_encoder", lambda: codec)
+
+    render_video(dummy_project, tmp_path / "output.mp4", hardware_encoding=True)
+
+    write_kwargs = written_videos[0].write_kwargs
+    assert write_kwargs["codec"] == codec
+    assert write_kwargs["ffmpeg_params"] == expected_params
+    assert "preset" not in write_kwargs
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"hardware_encoding": True, "codec": "libx264"},
+        {"hardware_encoding": True, "preset": "slow"},
+        {"hardware_encoding": True, "bitrate": "5000k"},
+        {"hardware_encoding": True, "ffmpeg_params": ["-tune", "film"]},
+    ],
+    ids=["default", "codec", "preset", "bitrate", "ffmpeg_params"],
+)
+def test_rendering_keeps_libx264(tmp_path, dummy_project, written_videos, monkeypatch, kwargs):
+    monkeypatch.setattr(rendering, "_detect_hardware_encoder", lambda: "h264_nvenc")
+
+    render_video(dummy_project, tmp_path / "output.mp4", **kwargs)
+
+    write_kwargs = written_videos[0].write_kwargs
+    assert write_kwargs["codec"] == "libx264"
+    assert write_kwargs.get("ffmpeg_params") == kwargs.get("ffmpeg_params")
+
+
+@pytest.mark.parametrize("kwargs, expected_preset", [({}, "veryfast"), ({"preset": "slow"}, "slow")])
+def test_rendering_libx264_preset(tmp_path, dummy_project, written_videos, monkeypatch, kwargs, expected_preset):
+    monkeypatch.setattr(rendering, "_detect_hardware_encoder", lambda: None)
+
+    render_video(dummy_project, tmp_path / "output.mp4", **kwargs)
+
+    assert written_videos[0].write_kwargs["codec"] == "libx264"
+    assert written_videos[0].write_kwargs["preset"] == expected_preset
+
+
+def test_detect_hardware_encoder_skips_unusable_encoders(monkeypatch):
+    encoders = " V....D h264_nvenc  NVIDIA NVENC\n V....D h264_qsv  Intel QSV\n"
+
+    def run(command, **kwargs):
+        if "-encoders" in command:
+            return subprocess.CompletedProcess(command, 0, stdout=encoders)
+        return subprocess.CompletedProcess(command, 0 if "h264_qsv" in command else 1)
+
+    monkeypatch.setattr(rendering.subprocess, "run", run)
+    _detect_hardware_encoder.cache_clear()
+    try:
+        assert _detect_hardware_encoder() == "h264_qsv"
+    finally:
+        _detect_hardware_encoder.cache_clear()
+
+
+def test_render_event_clips_keeps_asset_order():
+    image_buf = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(image_buf, format="PNG")
+
+    assets = [
+        create_asset("text", data="First"),
+        create_asset("image", data=image_buf.getvalue()),
+        create_asset("subtitle", data="Middle"),
+        create_asset("text", data="Second"),
+    ]
+    pairs = [(asset, AssetReference.from_asset(asset, start_time=i, end_time=i + 1)) for i, asset in enumerate(assets)]
+
+    video_clips, audio_clips = _render_event_clips(pairs, (640, 480))
+
+    assert [clip.start for clip in video_clips] == [0, 1, 2, 3]
+    assert audio_clips == []
+
+
+def test_make_asset_ref_clip_places_clip_and_mask():
+    asset = create_asset("text", data="Placed", params={"z_index": 3})
+    clip = _make_asset_ref_clip(asset, AssetReference.from_asset(asset, start_time=2, end_time=5), (640, 480))
+
+    assert (clip.start, clip.end, clip.duration, clip.layer_index) == (2, 5, 3, 3)
+    assert (clip.mask.start, clip.mask.end) == (2, 5)
+
+
+def test_render_event_clips_decodes_shared_image_once():
+    image_buf = io.BytesIO()
+    Image.new("RGB", (4, 4)).save(image_buf, format="PNG")
+    asset = create_asset("image", data=image_buf.getvalue())
+    pairs = [(asset, AssetReference.from_asset(asset, start_time=i, end_time=i + 1)) for i in range(3)]
+
+    video_clips, _ = _render_event_clips(pairs, (640, 480))
+
+    assert all(clip.img is video_clips[0].img for clip in video_clips)
+    assert _decoded_images.get() is None
@@ -155,6 +155,12 @@ def test_invalid_event():
         timeline.add_events(42)  # type: ignore
 
 
+def test_string_event_is_invalid():
+    timeline = Timeline()
+    with pytest.raises(ValueError, match="Invalid event type:"):
+        timeline.add_events("audio")  # type: ignore
+
+
 def test_timeline_iteration():
     timeline = Timeline()
     events = [